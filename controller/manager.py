@@ -13,7 +13,6 @@ from model.controller.device import EnergyMeterRecord
 from controller.registry.protocol import ProtocolRegistry
 from controller.meter.device import EnergyMeter
 from controller.node.node import Node
-from util.debug import LoggerManager
 
 #######################################
 
@@ -102,7 +101,7 @@ class DeviceManager:
         if device.measurements_queue != self.measurements_queue:
             device.measurements_queue = self.measurements_queue
         if device.last_seen_update is None:
-            device.last_seen_update = self.devices_db.update_device_last_seen
+            device.last_seen_update = self.devices_db.queue_device_last_seen
 
         await device.start()
         self.devices.add(device)
@@ -185,7 +184,7 @@ class DeviceManager:
             meter_options=record.options,
             communication_options=record.communication_options,
             nodes=self.create_nodes(record),
-            last_seen_update=self.devices_db.update_device_last_seen,
+            last_seen_update=self.devices_db.queue_device_last_seen,
         )
 
     def create_nodes(self, record: EnergyMeterRecord) -> Set[Node]:
@@ -2,7 +2,7 @@
 
 import asyncio
 import traceback
-from typing import Dict, Any, Set, Callable, Awaitable
+from typing import Dict, Any, List, Set, Callable, Awaitable
 from abc import abstractmethod
 
 #######################################
@@ -415,11 +415,7 @@ class EnergyMeter():
             EnergyMeterRecord: Record containing meter configuration and all associated nodes.
         """
 
-        node_records: Set[NodeRecord] = set()
-
-        for node in self.meter_nodes.nodes.values():
-            record = node.get_node_record()
-            node_records.add(record)
+        node_records: List[NodeRecord] = list(map(Node.get_node_record, self.meter_nodes.nodes.values()))
 
         return EnergyMeterRecord(
             name=self.name,
@@ -55,9 +55,9 @@ def get_meter_energy_consumption(
     active_energy_node_name = meter_util.create_node_name("active_energy", phase, direction)
     reactive_energy_node_name = meter_util.create_node_name("reactive_energy", phase, direction)
     pf_node_name = meter_util.create_node_name("power_factor", phase, None)
-    active_energy_node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == active_energy_node_name), None)
-    reactive_energy_node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == reactive_energy_node_name), None)
-    pf_node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == pf_node_name), None)
+    active_energy_node = device.meter_nodes.nodes.get(active_energy_node_name)
+    reactive_energy_node = device.meter_nodes.nodes.get(reactive_energy_node_name)
+    pf_node = device.meter_nodes.nodes.get(pf_node_name)
 
     if active_energy_node:
         active_energy_logs = timedb.get_variable_logs(device.name, device.id, active_energy_node, time_span)
@@ -181,9 +181,9 @@ def get_meter_peak_power(device: EnergyMeter, phase: NodePhase, timedb: TimeDBCl
     reactive_power_node_name = meter_util.create_node_name("reactive_power", phase, None)
     apparent_power_node_name = meter_util.create_node_name("apparent_power", phase, None)
 
-    active_power_node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == active_power_node_name), None)
-    reactive_power_node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == reactive_power_node_name), None)
-    apparent_power_node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == apparent_power_node_name), None)
+    active_power_node = device.meter_nodes.nodes.get(active_power_node_name)
+    reactive_power_node = device.meter_nodes.nodes.get(reactive_power_node_name)
+    apparent_power_node = device.meter_nodes.nodes.get(apparent_power_node_name)
 
     if active_power_node:
         active_power_logs = timedb.get_variable_logs(device.name, device.id, active_power_node, time_span, True)
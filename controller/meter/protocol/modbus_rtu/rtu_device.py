@@ -1,11 +1,12 @@
 ###########EXTERNAL IMPORTS############
 
 import asyncio
+import time
 import struct
 from pymodbus.pdu import ModbusPDU
 from pymodbus.client import AsyncModbusSerialClient as ModbusRTUClient
 from pymodbus import ModbusException
-from typing import Optional, Set, Dict, List, Callable, Awaitable, Any
+from typing import Optional, Set, FrozenSet, Dict, List, Callable, Awaitable, Any
 import logging
 
 #######################################
@@ -30,7 +31,7 @@ from controller.meter.device import EnergyMeter
 #######################################
 
 
-LoggerManager.get_logger(__name__).setLevel(logging.ERROR)
+logger = LoggerManager.get_logger(__name__, logging.ERROR)
 ModbusCall = Callable[[ModbusRTUClient, int, int, int, bool], Awaitable[ModbusPDU]]
 
 
@@ -59,6 +60,8 @@ class ModbusRTUEnergyMeter(EnergyMeter):
         client(Optional[ModbusRTUClient]):Active Modbus RTU client instance.
         modbus_function_map(Dict[ModbusRTUFunction,Callable]):Dispatch table mapping Modbus function enums to client read operations.
         get_value_map(Dict[ModbusRTUNodeType,Callable]):Dispatch table mapping node types to value decoding functions.
+        batch_groups(Dict[ModbusRTUFunction,List[ModbusRTUBatchGroup]]):Batch groups computed for all enabled batch read nodes.
+        batch_groups_nodes(FrozenSet[ModbusRTUNode] | None):Set of enabled batch read nodes from which batch_groups was computed.
     Class attributes:
         MAX_BATCH_SPAN(int):Maximum number of consecutive Modbus data units read in a single batch request.
         MAX_ADDRESS_GAP(int):Maximum allowed gap between node addresses within a batch group.
@@ -105,6 +108,9 @@ class ModbusRTUEnergyMeter(EnergyMeter):
         self.connection_task: asyncio.Task | None = None
         self.receiver_task: asyncio.Task | None = None
 
+        self.batch_groups: Dict[ModbusRTUFunction, List[ModbusRTUBatchGroup]] = {}
+        self.batch_groups_nodes: FrozenSet[ModbusRTUNode] | None = None
+
         self.modbus_function_map: Dict[ModbusRTUFunction, ModbusCall] = {
             ModbusRTUFunction.READ_COILS: lambda client, address, size, device_id, no_response_expected: client.read_coils(
                 address, count=size, device_id=device_id, no_response_expected=no_response_expected
@@ -197,8 +203,6 @@ class ModbusRTUEnergyMeter(EnergyMeter):
             RuntimeError: If the Modbus RTU client is not initialized.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         while self.run_connection_task:
             if self.client is None:
                 raise RuntimeError(f"Client {self.name} with id {self.id} is not initialized.")
@@ -225,17 +229,18 @@ class ModbusRTUEnergyMeter(EnergyMeter):
     async def receiver(self):
         """
         Continuously reads data from Modbus RTU nodes and updates their values.
+        Nodes with a poll period are only read on the cycles where that period has elapsed.
         Handles connection loss and logs per-node failures without stopping the loop.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         while self.run_receiver_task:
             try:
                 if self.network_connected and self.client:
+                    timestamp = time.monotonic()
                     enabled_nodes = [node for node in self.modbus_rtu_nodes if node.config.enabled]
-                    batch_read_nodes = [node for node in enabled_nodes if node.enable_batch_read]
-                    single_read_nodes = [node for node in enabled_nodes if not node.enable_batch_read]
+                    polled_nodes = [node for node in enabled_nodes if node.check_poll_due(timestamp)]
+                    batch_read_nodes = [node for node in polled_nodes if node.enable_batch_read]
+                    single_read_nodes = [node for node in polled_nodes if not node.enable_batch_read]
 
                     await self.process_batch_read(self.client, batch_read_nodes, single_read_nodes)
                     await self.process_single_reads(self.client, single_read_nodes)
@@ -270,26 +275,10 @@ class ModbusRTUEnergyMeter(EnergyMeter):
         batch group are scheduled for fallback single reads.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         if not batch_read_nodes:
             return
 
-        batch_by_function: Dict[ModbusRTUFunction, List[ModbusRTUBatchGroup]] = {}
-        batch_by_function[ModbusRTUFunction.READ_COILS] = self.create_batch_groups(
-            [node for node in batch_read_nodes if node.options.function is ModbusRTUFunction.READ_COILS]
-        )
-        batch_by_function[ModbusRTUFunction.READ_DISCRETE_INPUTS] = self.create_batch_groups(
-            [node for node in batch_read_nodes if node.options.function is ModbusRTUFunction.READ_DISCRETE_INPUTS]
-        )
-        batch_by_function[ModbusRTUFunction.READ_HOLDING_REGISTERS] = self.create_batch_groups(
-            [node for node in batch_read_nodes if node.options.function is ModbusRTUFunction.READ_HOLDING_REGISTERS]
-        )
-        batch_by_function[ModbusRTUFunction.READ_INPUT_REGISTERS] = self.create_batch_groups(
-            [node for node in batch_read_nodes if node.options.function is ModbusRTUFunction.READ_INPUT_REGISTERS]
-        )
-
-        for function, batch_groups in batch_by_function.items():
+        for function, batch_groups in self.get_batch_groups(batch_read_nodes).items():
             for group in batch_groups:
                 try:
                     results = await self.batch_read_nodes(client, function, group)
@@ -303,6 +292,71 @@ class ModbusRTUEnergyMeter(EnergyMeter):
                         f"Batch read failed for {function.name} (addr={group.start_addr}, size={group.size}) on device {self.name}: {e}"
                     )
 
+    def get_batch_groups(self, batch_read_nodes: List[ModbusRTUNode]) -> Dict[ModbusRTUFunction, List[ModbusRTUBatchGroup]]:
+        """
+        Return the batch groups for the given batch read nodes, grouped by Modbus function.
+
+        The group structure is computed over every enabled batch read node, so it is computed
+        once and reused on every cycle until a node is enabled, disabled, or moves between
+        batch and single reads. Nodes with a poll period are not due on every cycle, so the
+        cached groups are then narrowed to the nodes being read in the current cycle.
+
+        Args:
+            batch_read_nodes (List[ModbusRTUNode]):
+                Nodes eligible for batch reading in the current cycle.
+
+        Returns:
+            Dict[ModbusRTUFunction, List[ModbusRTUBatchGroup]]:
+                Batch groups for each Modbus read function.
+        """
+
+        batch_nodes = frozenset(node for node in self.modbus_rtu_nodes if node.config.enabled and node.enable_batch_read)
+        if batch_nodes != self.batch_groups_nodes:
+            self.batch_groups = {
+                function: self.create_batch_groups([node for node in batch_nodes if node.options.function is function])
+                for function in (
+                    ModbusRTUFunction.READ_COILS,
+                    ModbusRTUFunction.READ_DISCRETE_INPUTS,
+                    ModbusRTUFunction.READ_HOLDING_REGISTERS,
+                    ModbusRTUFunction.READ_INPUT_REGISTERS,
+                )
+            }
+            self.batch_groups_nodes = batch_nodes
+
+        due_nodes = set(batch_read_nodes)
+        if due_nodes == batch_nodes:
+            return self.batch_groups
+
+        due_batch_groups: Dict[ModbusRTUFunction, List[ModbusRTUBatchGroup]] = {}
+        for function, batch_groups in self.batch_groups.items():
+            due_batch_groups[function] = []
+            for group in batch_groups:
+                group_nodes = [node for node in group.nodes if node in due_nodes]
+                if group_nodes:
+                    due_batch_groups[function].append(self.get_narrowed_batch_group(group_nodes))
+
+        return due_batch_groups
+
+    def get_narrowed_batch_group(self, nodes: List[ModbusRTUNode]) -> ModbusRTUBatchGroup:
+        """
+        Build a batch group covering only the given nodes of a cached batch group.
+
+        The nodes are a subset of an existing group, so the narrowed address range always
+        respects the maximum address gap and batch span.
+
+        Args:
+            nodes (List[ModbusRTUNode]):
+                Nodes of a batch group to be read in the current cycle, sorted by address.
+
+        Returns:
+            ModbusRTUBatchGroup:
+                Batch group spanning from the first to the last of the given nodes.
+        """
+
+        start_addr = nodes[0].options.address
+        end_addr = max(node.options.address + MODBUS_RTU_TYPE_TO_SIZE_MAP[node.options.type] for node in nodes)
+        return ModbusRTUBatchGroup(start_addr=start_addr, size=end_addr - start_addr, nodes=nodes)
+
     async def process_single_reads(self, client: ModbusRTUClient, single_read_nodes: List[ModbusRTUNode]) -> None:
         """
         Perform individual Modbus reads for nodes not handled by batch reads.
@@ -311,8 +365,6 @@ class ModbusRTUEnergyMeter(EnergyMeter):
         Failed reads are logged and result values are set to None.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         if not single_read_nodes:
             return
 
@@ -1,6 +1,7 @@
 ############### EXTERNAL IMPORTS ###############
 
 import asyncio
+import time
 import asyncua
 from typing import Set, List, Dict, Optional, Any, Callable, Awaitable
 import logging
@@ -16,7 +17,7 @@ from controller.meter.device import EnergyMeter
 
 #######################################
 
-LoggerManager.get_logger(__name__).setLevel(logging.ERROR)
+logger = LoggerManager.get_logger(__name__, logging.ERROR)
 
 class OPCUAEnergyMeter(EnergyMeter):
     """
@@ -165,8 +166,6 @@ class OPCUAEnergyMeter(EnergyMeter):
             RuntimeError: If the OPC UA client is not initialized.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         while self.run_connection_task:
             if self.client is None:
                 raise RuntimeError(f"Client {self.name} with id {self.id} is not initialized.")
@@ -194,19 +193,20 @@ class OPCUAEnergyMeter(EnergyMeter):
         batch reads and individual reads. Nodes eligible for batch reading are
         processed together for efficiency, while nodes excluded from batch mode
         are read individually. After reading, node states are updated and
-        post-processing logic is executed.
+        post-processing logic is executed. Nodes with a poll period are only read
+        on the cycles where that period has elapsed.
 
         Runs continuously while the receiver task is active.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         while self.run_receiver_task:
             try:
                 if self.network_connected and self.client:
+                    timestamp = time.monotonic()
                     enabled_nodes = [node for node in self.opcua_nodes if node.config.enabled]
-                    batch_read_nodes = [node for node in enabled_nodes if node.enable_batch_read]
-                    single_read_nodes = [node for node in enabled_nodes if not node.enable_batch_read]
+                    polled_nodes = [node for node in enabled_nodes if node.check_poll_due(timestamp)]
+                    batch_read_nodes = [node for node in polled_nodes if node.enable_batch_read]
+                    single_read_nodes = [node for node in polled_nodes if not node.enable_batch_read]
 
                     await self.process_batch_read(self.client, batch_read_nodes, single_read_nodes)
                     await self.process_single_reads(self.client, single_read_nodes)
@@ -241,8 +241,6 @@ class OPCUAEnergyMeter(EnergyMeter):
             single_read_nodes (List[OPCUANode]): Nodes that should fall back to individual reads.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         if not batch_read_nodes:
             return
 
@@ -267,8 +265,6 @@ class OPCUAEnergyMeter(EnergyMeter):
             single_read_nodes (List[OPCUANode]): Nodes to be read individually.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         if not single_read_nodes:
             return
 
@@ -1,6 +1,8 @@
 ###########EXTERNAL IMPORTS############
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from dataclasses import fields
+from operator import attrgetter
 
 #######################################
 
@@ -14,6 +16,10 @@ from controller.registry.node_type import TypeRegistry
 #######################################
 
 
+"""Reads, in declaration order, the NodeConfig values persisted in a BaseNodeRecordConfig."""
+GET_RECORD_CONFIG_VALUES = attrgetter(*(field.name for field in fields(BaseNodeRecordConfig)))
+
+
 class Node:
     """
     Represents a single data point within a device.
@@ -38,12 +44,15 @@ class Node:
             internal node type.
     """
 
+    __slots__ = ("config", "protocol_options", "processor", "_record")
+
     def __init__(self, configuration: NodeConfig, protocol_options: BaseNodeProtocolOptions):
 
         configuration.validate()
         self.config = configuration
         self.protocol_options = protocol_options
         self.processor = TypeRegistry.get_type_plugin(configuration.type).node_processor_factory(configuration)
+        self._record: Optional[NodeRecord] = None
 
     def get_publish_format(self) -> Dict[str, Any]:
         """Returns the formatted value payload for publishing."""
@@ -60,34 +69,19 @@ class Node:
         Converts the node instance into a serializable NodeRecord object for database storage.
 
         Creates a record containing all node configuration, protocol options, attributes, and metadata
-        that can be persisted to the database and later reconstructed.
+        that can be persisted to the database and later reconstructed. The record is built on the
+        first call and reused afterwards, since the node configuration does not change after creation.
 
         Returns:
             NodeRecord: A representation of the current node suitable for database operations.
         """
 
-        base_config = BaseNodeRecordConfig(
-            enabled=self.config.enabled,
-            unit=self.config.unit,
-            publish=self.config.publish,
-            calculated=self.config.calculated,
-            custom=self.config.custom,
-            decimal_places=self.config.decimal_places,
-            logging=self.config.logging,
-            logging_period=self.config.logging_period,
-            min_alarm=self.config.min_alarm,
-            max_alarm=self.config.max_alarm,
-            min_alarm_value=self.config.min_alarm_value,
-            max_alarm_value=self.config.max_alarm_value,
-            min_warning=self.config.min_warning,
-            max_warning=self.config.max_warning,
-            min_warning_value=self.config.min_warning_value,
-            max_warning_value=self.config.max_warning_value,
-            is_counter=self.config.is_counter,
-            counter_mode=self.config.counter_mode,
-        )
+        if self._record is not None:
+            return self._record
 
-        return NodeRecord(
+        base_config = BaseNodeRecordConfig(*GET_RECORD_CONFIG_VALUES(self.config))
+
+        self._record = NodeRecord(
             device_id=None,
             name=self.config.name,
             protocol=self.config.protocol,
@@ -95,6 +89,7 @@ class Node:
             protocol_options=self.protocol_options,
             attributes=self.config.attributes,
         )
+        return self._record
 
 
 ###########     P R O T O C O L     S P E C I F I C     N O D E S     ###########
@@ -118,12 +113,15 @@ class ModbusRTUNode(Node):
 
     MAX_NUMBER_FAILS = 3
 
+    __slots__ = ("options", "connected", "enable_batch_read", "number_fails", "last_poll")
+
     def __init__(self, configuration: NodeConfig, protocol_options: ModbusRTUNodeOptions):
         super().__init__(configuration=configuration, protocol_options=protocol_options)
         self.options = protocol_options
         self.connected = False
         self.enable_batch_read = True
         self.number_fails = 0
+        self.last_poll: Optional[float] = None
 
     def set_connection_state(self, state: bool):
         """
@@ -153,6 +151,27 @@ class ModbusRTUNode(Node):
         self.number_fails = 0
         self.enable_batch_read = True
 
+    def check_poll_due(self, timestamp: float) -> bool:
+        """
+        Check whether the node must be read at the given time according to its poll period.
+
+        Nodes without a poll period are read on every device read cycle. When the node is due,
+        the timestamp is registered as its last poll time.
+
+        Args:
+            timestamp (float): Current monotonic time in seconds.
+
+        Returns:
+            bool: True if the node should be read in the current cycle.
+        """
+
+        poll_period = self.options.poll_period
+        if poll_period is not None and self.last_poll is not None and timestamp - self.last_poll < poll_period:
+            return False
+
+        self.last_poll = timestamp
+        return True
+
 
 # OPC UA Node
 class OPCUANode(Node):
@@ -171,12 +190,15 @@ class OPCUANode(Node):
 
     MAX_NUMBER_FAILS = 3
 
+    __slots__ = ("options", "connected", "enable_batch_read", "number_fails", "last_poll")
+
     def __init__(self, configuration: NodeConfig, protocol_options: OPCUANodeOptions):
         super().__init__(configuration=configuration, protocol_options=protocol_options)
         self.options = protocol_options
         self.connected = False
         self.enable_batch_read = True
         self.number_fails = 0
+        self.last_poll: Optional[float] = None
 
     def set_connection_state(self, state: bool):
         """
@@ -206,5 +228,26 @@ class OPCUANode(Node):
         self.number_fails = 0
         self.enable_batch_read = True
 
+    def check_poll_due(self, timestamp: float) -> bool:
+        """
+        Check whether the node must be read at the given time according to its poll period.
+
+        Nodes without a poll period are read on every device read cycle. When the node is due,
+        the timestamp is registered as its last poll time.
+
+        Args:
+            timestamp (float): Current monotonic time in seconds.
+
+        Returns:
+            bool: True if the node should be read in the current cycle.
+        """
+
+        poll_period = self.options.poll_period
+        if poll_period is not None and self.last_poll is not None and timestamp - self.last_poll < poll_period:
+            return False
+
+        self.last_poll = timestamp
+        return True
+
 
 #################################################################################
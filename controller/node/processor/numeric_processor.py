@@ -1,7 +1,7 @@
 ###########EXTERNAL IMPORTS############
 
 from typing import Dict, Any, Optional, Type
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from datetime import datetime
 
 #######################################
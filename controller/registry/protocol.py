@@ -1,7 +1,7 @@
 ###########EXTERNAL IMPORTS############
 
 from dataclasses import dataclass
-from typing import Callable, Dict, Set, Optional, Any, Type
+from typing import Callable, Collection, Dict, Optional, Any, Type
 
 #######################################
 
@@ -25,7 +25,13 @@ from web.parsers.protocol.no_protocol import parse_no_protocol_node_protocol_opt
 
 NodeFactory = Callable[[NodeRecord], Node]
 NodeRecordFactory = Callable[[str, str, Dict[str, Any], Dict[str, Any], Dict[str, Any]], NodeRecord]
-MeterRecordFactory = Callable[[int, str, str, str, Dict[str, Any], Dict[str, Any], Set[NodeRecord]], EnergyMeterRecord]
+MeterRecordFactory = Callable[[int, str, str, str, Dict[str, Any], Dict[str, Any], Collection[NodeRecord]], EnergyMeterRecord]
+
+"""Protocol members indexed by their stored value, avoiding the Enum constructor on every converted row."""
+PROTOCOLS_BY_VALUE: Dict[str, Protocol] = {protocol.value: protocol for protocol in Protocol}
+
+"""Energy meter types indexed by their stored value, avoiding the Enum constructor on every converted row."""
+METER_TYPES_BY_VALUE: Dict[str, EnergyMeterType] = {meter_type.value: meter_type for meter_type in EnergyMeterType}
 
 
 @dataclass
@@ -102,7 +108,7 @@ class ProtocolRegistry:
 
         if isinstance(protocol, str):
             try:
-                protocol = Protocol(protocol)
+                protocol = PROTOCOLS_BY_VALUE[protocol]
             except Exception as e:
                 raise ValueError(f"Invalid protocol {protocol} trying to be converted.")
 
@@ -128,7 +134,7 @@ def _no_protocol_node_record_factory(
 
     return NodeRecord(
         name=str(name),
-        protocol=Protocol(protocol),
+        protocol=PROTOCOLS_BY_VALUE[protocol],
         config=BaseNodeRecordConfig.cast_from_dict(config_dict),
         protocol_options=NoProtocolNodeOptions.cast_from_dict(protocol_options_dict),
         attributes=NodeAttributes.cast_from_dict(attributes_dict),
@@ -167,14 +173,14 @@ def _modbus_rtu_meter_record_factory(
     type: str,
     options_dict: Dict[str, Any],
     communication_options_dict: Dict[str, Any],
-    nodes: Set[NodeRecord],
+    nodes: Collection[NodeRecord],
 ) -> EnergyMeterRecord:
     """Create an EnergyMeterRecord instance for a Modbus RTU device."""
 
     return EnergyMeterRecord(
         name=str(name),
-        protocol=Protocol(protocol),
-        type=EnergyMeterType(type),
+        protocol=PROTOCOLS_BY_VALUE[protocol],
+        type=METER_TYPES_BY_VALUE[type],
         options=EnergyMeterOptions.cast_from_dict(options_dict),
         communication_options=ModbusRTUOptions.cast_from_dict(communication_options_dict),
         nodes=nodes,
@@ -193,7 +199,7 @@ def _modbus_rtu_node_record_factory(
 
     return NodeRecord(
         name=str(name),
-        protocol=Protocol(protocol),
+        protocol=PROTOCOLS_BY_VALUE[protocol],
         config=BaseNodeRecordConfig.cast_from_dict(config_dict),
         protocol_options=ModbusRTUNodeOptions.cast_from_dict(protocol_options_dict),
         attributes=NodeAttributes.cast_from_dict(attributes_dict),
@@ -232,14 +238,14 @@ def _opc_ua_meter_record_factory(
     type: str,
     options_dict: Dict[str, Any],
     communication_options_dict: Dict[str, Any],
-    nodes: Set[NodeRecord],
+    nodes: Collection[NodeRecord],
 ) -> EnergyMeterRecord:
     """Create an EnergyMeterRecord instance for a OPC UA device."""
 
     return EnergyMeterRecord(
         name=str(name),
-        protocol=Protocol(protocol),
-        type=EnergyMeterType(type),
+        protocol=PROTOCOLS_BY_VALUE[protocol],
+        type=METER_TYPES_BY_VALUE[type],
         options=EnergyMeterOptions.cast_from_dict(options_dict),
         communication_options=OPCUAOptions.cast_from_dict(communication_options_dict),
         nodes=nodes,
@@ -258,7 +264,7 @@ def _opc_ua_node_record_factory(
 
     return NodeRecord(
         name=str(name),
-        protocol=Protocol(protocol),
+        protocol=PROTOCOLS_BY_VALUE[protocol],
         config=BaseNodeRecordConfig.cast_from_dict(config_dict),
         protocol_options=OPCUANodeOptions.cast_from_dict(protocol_options_dict),
         attributes=NodeAttributes.cast_from_dict(attributes_dict),
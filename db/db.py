@@ -1,59 +1,356 @@
 ############### EXTERNAL IMPORTS ################
 
+import asyncio
 import aiosqlite
 import json
-from typing import List, Dict, Tuple, Set, Any, Optional
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Collection, List, Dict, Tuple, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 #################################################
 
 ############### LOCAL IMPORTS ###################
 
 from util.debug import LoggerManager
-from controller.registry.protocol import ProtocolRegistry
+from controller.registry.protocol import ProtocolRegistry, NodeRecordFactory, MeterRecordFactory
 from model.controller.device import EnergyMeterRecord, DeviceHistoryStatus
 from model.controller.node import NodeRecord
+import util.functions.date as date
 
 #################################################
 
 
+logger = LoggerManager.get_logger(__name__)
+
+
+if orjson is not None:
+
+    def json_dumps(obj: Any) -> str:
+        """Serializes an object into compact JSON text using orjson."""
+
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+
+else:
+
+    def json_dumps(obj: Any) -> str:
+        """Serializes an object into compact JSON text using the standard library."""
+
+        return json.dumps(obj, separators=(",", ":"))
+
+    json_loads = json.loads
+
+
+"""
+Connection tuning applied to every SQLite connection. With WAL enabled, synchronous=NORMAL only
+syncs on checkpoints, so a power loss may roll back the last commits but never corrupts the database.
+"""
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA busy_timeout=5000;
+    PRAGMA cache_size=-20000;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA journal_size_limit=6144000;
+    PRAGMA wal_autocheckpoint=1000;
+"""
+
+
+"""Default number of read-only connections opened next to the writer connection."""
+DEFAULT_READER_COUNT = os.cpu_count() or 1
+
+
+"""
+Schema migrations, where entry N upgrades a database from PRAGMA user_version N to N + 1.
+The first migration uses IF NOT EXISTS so databases created before schema versioning are adopted as version 1.
+"""
+SCHEMA_MIGRATIONS: List[str] = [
+    """
+    CREATE TABLE IF NOT EXISTS devices (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        protocol TEXT NOT NULL,
+        device_type TEXT NOT NULL,
+        meter_options TEXT NOT NULL,
+        communication_options TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS nodes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        device_id INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        protocol TEXT NOT NULL,
+        config TEXT NOT NULL,
+        protocol_options TEXT NOT NULL,
+        attributes TEXT NOT NULL,
+        FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_nodes_device_id ON nodes(device_id);
+
+    CREATE TABLE IF NOT EXISTS device_status (
+        device_id INTEGER PRIMARY KEY,
+        last_seen TEXT DEFAULT NULL,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT DEFAULT NULL,
+        FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE
+    );
+    """,
+    """
+    CREATE UNIQUE INDEX idx_nodes_device_id_name ON nodes(device_id, name);
+    DROP INDEX IF EXISTS idx_nodes_device_id;
+    """,
+]
+
+
+"""Schema version that makes node names unique per device and can only be applied without duplicate nodes."""
+UNIQUE_NODE_NAMES_VERSION = 2
+
+
+"""Query listing the node names stored more than once for the same device, with their row count."""
+SELECT_DUPLICATE_NODES_SQL = """
+    SELECT device_id, name, COUNT(*) FROM nodes
+    GROUP BY device_id, name
+    HAVING COUNT(*) > 1
+"""
+
+
+"""Statement inserting a device row and returning its generated id."""
+INSERT_DEVICE_SQL = """
+    INSERT INTO devices (name, protocol, device_type, meter_options, communication_options)
+    VALUES (?, ?, ?, ?, ?)
+    RETURNING id
+"""
+
+
+"""Statement updating a device row in place, returning its id only when the device exists."""
+UPDATE_DEVICE_SQL = """
+    UPDATE devices
+    SET name = ?, protocol = ?, device_type = ?, meter_options = ?, communication_options = ?
+    WHERE id = ?
+    RETURNING id
+"""
+
+
+"""Statement deleting a device row (nodes and status cascade), returning its id only when the device existed."""
+DELETE_DEVICE_SQL = "DELETE FROM devices WHERE id = ? RETURNING id"
+
+
+"""Statement creating the default status row of a device."""
+INSERT_DEVICE_STATUS_SQL = "INSERT INTO device_status (device_id, created_at) VALUES (?, ?)"
+
+
+"""Statement refreshing the update timestamp of a device status row."""
+UPDATE_DEVICE_STATUS_SQL = "UPDATE device_status SET updated_at = ? WHERE device_id = ?"
+
+
+"""Query returning the stored node payloads of a device, keyed by node name."""
+SELECT_DEVICE_NODES_SQL = "SELECT name, protocol, config, protocol_options, attributes FROM nodes WHERE device_id = ?"
+
+
+"""Statement deleting a single node of a device by name."""
+DELETE_NODE_SQL = "DELETE FROM nodes WHERE device_id = ? AND name = ?"
+
+
+"""Statement used to insert a node row, shared by every node batch insert."""
+INSERT_NODE_SQL = """
+    INSERT INTO nodes (device_id, name, protocol, config, protocol_options, attributes)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+"""Statement inserting a node row or, when the device already has a node with that name, replacing its payload."""
+UPSERT_NODE_SQL = """
+    INSERT INTO nodes (device_id, name, protocol, config, protocol_options, attributes)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(device_id, name) DO UPDATE SET
+    protocol = excluded.protocol,
+    config = excluded.config,
+    protocol_options = excluded.protocol_options,
+    attributes = excluded.attributes
+"""
+
+
+"""Query loading every device together with its nodes, one row per node (or one NULL-node row for empty devices)."""
+SELECT_ENERGY_METERS_SQL = """
+    SELECT d.id, d.name, d.protocol, d.device_type, d.meter_options, d.communication_options,
+           n.name, n.protocol, n.config, n.protocol_options, n.attributes
+    FROM devices d
+    LEFT JOIN nodes n ON n.device_id = d.id
+    ORDER BY d.id
+"""
+
+
+"""Statement refreshing the last seen timestamp of an existing device status row."""
+UPDATE_LAST_SEEN_SQL = "UPDATE device_status SET last_seen = ? WHERE device_id = ?"
+
+
+"""Fallback statement creating the device status row when it does not exist yet."""
+INSERT_LAST_SEEN_SQL = """
+    INSERT INTO device_status (device_id, last_seen, created_at)
+    VALUES (?, ?, ?)
+    ON CONFLICT(device_id) DO UPDATE SET
+    last_seen = excluded.last_seen
+"""
+
+
+"""Query returning the status timestamps of a device."""
+SELECT_DEVICE_HISTORY_SQL = "SELECT last_seen, created_at, updated_at FROM device_status WHERE device_id = ?"
+
+
+"""Format of the UTC timestamps stored in device_status, matching SQLite's CURRENT_TIMESTAMP."""
+STATUS_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+"""Seconds between batched writes of queued last seen updates."""
+LAST_SEEN_FLUSH_INTERVAL = 1.0
+
+
+"""Number of rows fetched per round trip when streaming query results."""
+FETCH_CHUNK_SIZE = 256
+
+
+def get_status_timestamp() -> str:
+    """
+    Returns the current UTC time formatted for the device_status timestamp columns.
+
+    Timestamps are taken once in Python and bound as parameters, so every status row written
+    by one operation carries the same instant.
+
+    Returns:
+        str: Current UTC time formatted with STATUS_TIMESTAMP_FORMAT.
+    """
+
+    return date.get_current_utc_datetime().strftime(STATUS_TIMESTAMP_FORMAT)
+
+
+def get_node_rows(device_id: int, nodes: Collection[NodeRecord]) -> List[Tuple[Any, ...]]:
+    """
+    Builds the INSERT_NODE_SQL parameter rows for the nodes of a device.
+
+    Args:
+        device_id (int): Identifier of the device that owns the nodes.
+        nodes (Collection[NodeRecord]): Node records to persist.
+
+    Returns:
+        List[Tuple[Any, ...]]: One parameter tuple per node.
+    """
+
+    rows: List[Tuple[Any, ...]] = []
+    for node in nodes:
+        rows.append(
+            (
+                device_id,
+                node.name,
+                node.protocol,
+                json_dumps(node.config.get_config()),
+                json_dumps(node.protocol_options.get_options()),
+                json_dumps(node.attributes.get_attributes()),
+            )
+        )
+    return rows
+
+
 class SQLiteDBClient:
     """
     Async SQLite database client for energy meter device and node configuration management.
 
     Provides CRUD operations for devices and their associated data nodes with WAL mode
-    for concurrent access and foreign key constraints for data integrity.
+    for concurrent access and foreign key constraints for data integrity. Writes go through
+    a single writer connection while reads are served by a pool of read-only connections,
+    so queries do not wait behind write commits.
 
     Attributes:
         db_path (str): Path to the SQLite database file.
-        conn (sqlite3.Connection): Database connection object.
+        reader_count (int): Number of read-only connections to open.
+        conn (sqlite3.Connection): Writer database connection object.
         cursor (sqlite3.Cursor): Database cursor for executing queries.
+        readers (List[aiosqlite.Connection]): Open read-only connections.
+        idle_readers (asyncio.Queue[aiosqlite.Connection]): Read-only connections available for use.
+        write_lock (asyncio.Lock): Serializes transactions on the writer connection.
+        pending_last_seen (Dict[int, str]): Latest queued last seen timestamp per device, awaiting flush.
+        last_seen_task (Optional[asyncio.Task]): Background task periodically flushing queued last seen updates.
     """
 
-    def __init__(self, db_path: str = "config.db"):
+    def __init__(self, db_path: str = "config.db", reader_count: int = DEFAULT_READER_COUNT):
         self.db_path = db_path
+        self.reader_count = reader_count
         self.conn: Optional[aiosqlite.Connection] = None
         self.cursor: Optional[aiosqlite.Cursor] = None
+        self.readers: List[aiosqlite.Connection] = []
+        self.idle_readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self.write_lock = asyncio.Lock()
+        self.pending_last_seen: Dict[int, str] = {}
+        self.last_seen_task: Optional[asyncio.Task] = None
 
     async def init_connection(self) -> None:
         """
         Initiates the SQLite connection.
         Should be called during application initialization.
+
+        Connections run in WAL mode with synchronous=NORMAL: commits skip the fsync, so the last
+        transactions may roll back after a power loss or OS crash, but the database stays consistent.
+        The WAL file is truncated back to journal_size_limit after checkpoints.
         """
 
         if self.conn is not None or self.cursor is not None:
             raise RuntimeError("DB connection is already instantiated")
         self.conn = await aiosqlite.connect(self.db_path)
-        await self.conn.execute("PRAGMA journal_mode=WAL;")  # Enable WAL mode
+        if self.db_path != ":memory:":
+            await self.conn.execute("PRAGMA journal_mode=WAL;")  # Enable WAL mode (not supported in memory)
         await self.conn.execute("PRAGMA foreign_keys=ON;")  # Enable foreign key constraints
+        await self.conn.executescript(CONNECTION_PRAGMAS)  # Reduce syncs and keep hot pages in memory
         await self.create_tables()
+        await self.open_readers()
+        self.last_seen_task = asyncio.get_running_loop().create_task(self.last_seen_writer())
+
+    async def open_readers(self) -> None:
+        """
+        Opens the pool of read-only connections used by the query methods.
+
+        In-memory databases are private to their connection, so no readers are opened for them
+        and reads fall back to the writer connection.
+        """
+
+        if self.db_path == ":memory:":
+            return
+        reader_uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        for _ in range(self.reader_count):
+            reader = await aiosqlite.connect(reader_uri, uri=True)
+            await reader.executescript(CONNECTION_PRAGMAS)
+            self.readers.append(reader)
+            self.idle_readers.put_nowait(reader)
 
     async def close_connection(self) -> None:
         """
-        Closes the SQLite connection.
+        Closes the SQLite connections.
         Should be called during application shutdown.
+        Queued last seen updates are flushed before the writer connection is closed.
         """
 
+        if self.last_seen_task:
+            self.last_seen_task.cancel()
+            try:
+                await self.last_seen_task
+            except asyncio.CancelledError:
+                pass
+            self.last_seen_task = None
+            await self.flush_last_seen()
+
+        for reader in self.readers:
+            await reader.close()
+        self.readers.clear()
+        self.idle_readers = asyncio.Queue()
+
         if self.conn:
+            await self.conn.execute("PRAGMA optimize;")  # Update planner statistics where they drifted
             await self.conn.close()
             self.conn = None
 
@@ -71,6 +368,52 @@ class SQLiteDBClient:
             )
         return self.conn
 
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrows a read-only connection from the pool for the duration of the context.
+
+        Falls back to the writer connection when no readers are open.
+
+        Yields:
+            aiosqlite.Connection: Connection to run read queries on.
+        """
+
+        if not self.readers:
+            yield self.require_client()
+            return
+
+        conn = await self.idle_readers.get()
+        try:
+            yield conn
+        finally:
+            self.idle_readers.put_nowait(conn)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Runs the enclosed operations as a single write transaction on the writer connection.
+
+        The transaction is opened with BEGIN IMMEDIATE so the database write lock is taken
+        upfront, committed when the context exits normally and rolled back if it raises.
+        Foreign key checks are deferred to the commit, so intermediate states within the
+        transaction are not validated statement by statement. Concurrent callers are
+        serialized, since they all share the writer connection.
+
+        Yields:
+            aiosqlite.Connection: Writer connection with the open transaction.
+        """
+
+        conn = self.require_client()
+        async with self.write_lock:
+            await conn.executescript("BEGIN IMMEDIATE; PRAGMA defer_foreign_keys=ON;")
+            try:
+                yield conn
+                await conn.commit()  # Deferred foreign key violations surface here
+            except BaseException:
+                await conn.rollback()
+                raise
+
     async def create_tables(self) -> None:
         """
         Creates the required SQLite tables for storing energy meter configurations and operational status.
@@ -81,54 +424,67 @@ class SQLiteDBClient:
             - device_status: Stores operational status information for each device including connection timestamps and status tracking.
 
         Notes:
-            - Each node is linked to a device via a foreign key (device_id).
+            - Each node is linked to a device via a foreign key (device_id). Node names are unique per device,
+              enforced by the (device_id, name) index that also serves per-device lookups.
             - Each device_status entry is linked to a device via a foreign key (device_id).
             - Devices use an auto-incrementing primary key (id).
             - Nodes and device_status entries are automatically deleted if their parent device is removed (ON DELETE CASCADE).
             - Device status table tracks last seen time, and record timestamps.
+            - The schema version is kept in PRAGMA user_version and only pending SCHEMA_MIGRATIONS are applied,
+              so an up-to-date database skips the DDL entirely.
         """
 
-        logger = LoggerManager.get_logger(__name__)
         conn = self.require_client()
 
         try:
-
-            await conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS devices (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    protocol TEXT NOT NULL,
-                    device_type TEXT NOT NULL,
-                    meter_options TEXT NOT NULL,
-                    communication_options TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS nodes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    device_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    protocol TEXT NOT NULL,
-                    config TEXT NOT NULL,
-                    protocol_options TEXT NOT NULL,
-                    attributes TEXT NOT NULL,
-                    FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE
-                );
-
-                CREATE TABLE IF NOT EXISTS device_status (
-                    device_id INTEGER PRIMARY KEY,
-                    last_seen TEXT DEFAULT NULL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TEXT DEFAULT NULL,
-                    FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE
-                );
-            """
-            )
-            await conn.commit()
+            async with conn.execute("PRAGMA user_version") as cursor:
+                (schema_version,) = await cursor.fetchone()
+
+            # Apply only the migrations newer than the stored schema version, each in its own transaction
+            for version, migration in enumerate(SCHEMA_MIGRATIONS[schema_version:], start=schema_version + 1):
+                if version == UNIQUE_NODE_NAMES_VERSION:
+                    await self.check_duplicate_nodes(conn)
+                try:
+                    await conn.executescript(f"BEGIN; {migration} PRAGMA user_version = {version}; COMMIT;")
+                except Exception:
+                    await conn.rollback()  # A failed script leaves its transaction open
+                    raise
+
+            # Refresh planner statistics after schema changes so new indexes are picked up
+            if schema_version < len(SCHEMA_MIGRATIONS):
+                await conn.execute("ANALYZE;")
         except Exception as e:
             logger.exception(f"Failed to create tables: {e}")
             raise
 
+    async def check_duplicate_nodes(self, conn: aiosqlite.Connection) -> None:
+        """
+        Ensures no device stores the same node name more than once before node names are made unique.
+
+        Duplicate nodes are never removed automatically, since there is no way to tell which
+        row holds the intended configuration. They have to be resolved by the operator before
+        the schema can be upgraded.
+
+        Args:
+            conn (aiosqlite.Connection): Active SQLite database connection.
+
+        Raises:
+            RuntimeError: If duplicate nodes are found, listing them.
+        """
+
+        async with conn.execute(SELECT_DUPLICATE_NODES_SQL) as cursor:
+            duplicates = await cursor.fetchall()
+
+        if duplicates:
+            details = ", ".join(
+                f"device {device_id} node '{name}' ({count} rows)" for device_id, name, count in duplicates
+            )
+            logger.error(f"Cannot upgrade schema to version {UNIQUE_NODE_NAMES_VERSION}, duplicate nodes found: {details}")
+            raise RuntimeError(
+                f"Found {len(duplicates)} duplicate node names. "
+                "Remove the extra node rows and restart to upgrade the schema."
+            )
+
     async def insert_energy_meter(self, record: EnergyMeterRecord, conn: aiosqlite.Connection) -> int | None:
         """
         Inserts a new energy meter (device) into the database along with all associated
@@ -136,8 +492,8 @@ class SQLiteDBClient:
 
         This method performs multiple INSERT operations using the provided database
         cursor but does NOT manage the transaction lifecycle. It assumes an active
-        transaction context controlled by the caller. No commit or rollback is
-        performed inside this method.
+        transaction context controlled by the caller, usually opened with
+        transaction(). No commit or rollback is performed inside this method.
 
         Args:
             record (EnergyMeterRecord): Structured energy meter data, including device
@@ -145,76 +501,51 @@ class SQLiteDBClient:
             conn (aiosqlite.Connection): Active SQLite database connection.
 
         Returns:
-            int | None: The ID of the newly inserted device if successful, None if an
-            error occurs during insertion.
-        """
+            int | None: The ID of the newly inserted device if successful, None if a
+            database error occurs during insertion.
 
-        logger = LoggerManager.get_logger(__name__)
+        Raises:
+            Exception: Any non-database error (e.g. while serializing the record) is
+                propagated so the caller's transaction is rolled back.
+        """
 
         try:
             async with conn.execute(
-                """
-                INSERT INTO devices (name, protocol, device_type, meter_options, communication_options)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                INSERT_DEVICE_SQL,
                 (
                     record.name,
                     record.protocol,
                     record.type,
-                    json.dumps(record.options.get_meter_options()),
-                    json.dumps(record.communication_options.get_communication_options()),
+                    json_dumps(record.options.get_meter_options()),
+                    json_dumps(record.communication_options.get_communication_options()),
                 ),
             ) as cursor:
-                device_id = cursor.lastrowid
-
-            for node in record.nodes:
-                node.device_id = device_id
-                await conn.execute(
-                    """
-                    INSERT INTO nodes (device_id, name, protocol, config, protocol_options, attributes)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        device_id,
-                        node.name,
-                        node.protocol,
-                        json.dumps(node.config.get_config()),
-                        json.dumps(node.protocol_options.get_options()),
-                        json.dumps(node.attributes.get_attributes()),
-                    ),
-                )
+                (device_id,) = await cursor.fetchone()
+
+            await conn.executemany(INSERT_NODE_SQL, get_node_rows(device_id, record.nodes))
 
             # Create initial device status entry
-            await conn.execute(
-                """
-                INSERT INTO device_status (device_id)
-                VALUES (?)
-                """,
-                (device_id,),
-            )
+            await conn.execute(INSERT_DEVICE_STATUS_SQL, (device_id, get_status_timestamp()))
 
             return device_id
 
-        except aiosqlite.OperationalError as e:
-            logger.error(f"Operational error while trying to insert energy meter {record.name}: {e}")
-            return None
-        except Exception as e:
+        except aiosqlite.Error as e:
+            logger.error(f"Database error while trying to insert energy meter {record.name}: {e}")
             return None
 
     async def update_energy_meter(self, record: EnergyMeterRecord, conn: aiosqlite.Connection) -> bool:
         """
-        Updates an existing energy meter configuration by fully replacing its
-        device and node definitions.
+        Updates an existing energy meter configuration in place.
 
-        This method performs a complete replacement of the energy meter data by
-        deleting the existing device and its associated nodes, then inserting the
-        updated configuration. The device status record is preserved when present
-        and its timestamps are updated accordingly.
+        The device row is updated and its nodes are diffed by name against the stored
+        ones: new nodes are inserted, changed nodes are updated and nodes no longer
+        present are deleted, so unchanged rows are left untouched. The device status
+        record is preserved and its update timestamp is refreshed.
 
         This method executes multiple database operations using the provided
         cursor but does NOT manage the transaction lifecycle. It assumes an active
-        transaction context controlled by the caller. No commit or rollback is
-        performed inside this method.
+        transaction context controlled by the caller, usually opened with
+        transaction(). No commit or rollback is performed inside this method.
 
         Args:
             record (EnergyMeterRecord): Updated energy meter configuration, including
@@ -223,92 +554,59 @@ class SQLiteDBClient:
             conn (aiosqlite.Connection): Active SQLite database connection.
 
         Returns:
-            bool: True if the update operations complete successfully, False if an
-            error occurs or the specified device does not exist.
-        """
+            bool: True if the update operations complete successfully, False if a
+            database error occurs or the specified device does not exist.
 
-        logger = LoggerManager.get_logger(__name__)
+        Raises:
+            Exception: Any non-database error (e.g. while serializing the record) is
+                propagated so the caller's transaction is rolled back.
+        """
 
         if record.id is None:
             logger.error("Cannot update energy meter: record ID is required")
             return False
 
         try:
-            # Retrieve existing device status to preserve timestamps
+            # Update the device configuration
             async with conn.execute(
-                """
-                SELECT last_seen, created_at 
-                FROM device_status 
-                WHERE device_id = ?
-                """,
-                (record.id,),
-            ) as cursor:
-                status_data = await cursor.fetchone()
-
-            # Delete existing nodes and device
-            await conn.execute("DELETE FROM nodes WHERE device_id = ?", (record.id,))
-            async with conn.execute("DELETE FROM devices WHERE id = ?", (record.id,)) as cursor:
-                if not cursor.rowcount:
-                    logger.warning(f"No energy meter found with ID {record.id}")
-                    return False
-
-            # Insert the updated device configuration
-            await conn.execute(
-                """
-                INSERT INTO devices (id, name, protocol, device_type, meter_options, communication_options)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                UPDATE_DEVICE_SQL,
                 (
-                    record.id,
                     record.name,
                     record.protocol,
                     record.type,
-                    json.dumps(record.options.get_meter_options()),
-                    json.dumps(record.communication_options.get_communication_options()),
+                    json_dumps(record.options.get_meter_options()),
+                    json_dumps(record.communication_options.get_communication_options()),
+                    record.id,
                 ),
-            )
+            ) as cursor:
+                if await cursor.fetchone() is None:
+                    logger.warning(f"No energy meter found with ID {record.id}")
+                    return False
 
-            # Insert all associated nodes
-            for node in record.nodes:
-                node.device_id = record.id
-                await conn.execute(
-                    """
-                    INSERT INTO nodes (device_id, name, protocol, config, protocol_options, attributes)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        record.id,
-                        node.name,
-                        node.protocol,
-                        json.dumps(node.config.get_config()),
-                        json.dumps(node.protocol_options.get_options()),
-                        json.dumps(node.attributes.get_attributes()),
-                    ),
-                )
+            # Diff the stored nodes against the updated ones
+            async with conn.execute(SELECT_DEVICE_NODES_SQL, (record.id,)) as cursor:
+                stored_nodes = {row[0]: row[1:] for row in await cursor.fetchall()}
 
-            # Update or create device history status
-            if status_data:
-                await conn.execute(
-                    """
-                    INSERT INTO device_status (device_id, last_seen, created_at, updated_at)
-                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                    """,
-                    (record.id, status_data[0], status_data[1]),
-                )
-            else:
-                await conn.execute(
-                    """
-                    INSERT INTO device_status (device_id)
-                    VALUES (?)
-                    """,
-                    (record.id,),
-                )
+            # New and changed nodes are written by one upsert batch; unchanged ones are skipped
+            node_rows = get_node_rows(record.id, record.nodes)
+            upsert_rows = [row for row in node_rows if stored_nodes.pop(row[1], None) != row[2:]]
+
+            if upsert_rows:
+                await conn.executemany(UPSERT_NODE_SQL, upsert_rows)
+            if stored_nodes:
+                await conn.executemany(DELETE_NODE_SQL, [(record.id, name) for name in stored_nodes])
+
+            # Refresh device history status or create it if missing
+            timestamp = get_status_timestamp()
+            async with conn.execute(UPDATE_DEVICE_STATUS_SQL, (timestamp, record.id)) as cursor:
+                status_updated = cursor.rowcount > 0
+
+            if not status_updated:
+                await conn.execute(INSERT_DEVICE_STATUS_SQL, (record.id, timestamp))
 
             return True
-        except aiosqlite.OperationalError as e:
-            logger.error(f"Operational error while trying to update energy meter {record.name} with id {record.id}: {e}")
-            return False
-        except Exception as e:
+        except aiosqlite.Error as e:
+            logger.error(f"Database error while trying to update energy meter {record.name} with id {record.id}: {e}")
             return False
 
     async def delete_device(self, device_id: int, conn: aiosqlite.Connection) -> bool:
@@ -321,8 +619,8 @@ class SQLiteDBClient:
 
         This method executes a DELETE operation using the provided cursor but does
         NOT manage the transaction lifecycle. It assumes an active transaction
-        context controlled by the caller. No commit or rollback is performed inside
-        this method.
+        context controlled by the caller, usually opened with transaction(). No
+        commit or rollback is performed inside this method.
 
         Args:
             device_id (int): The unique ID of the device to delete.
@@ -330,7 +628,7 @@ class SQLiteDBClient:
 
         Returns:
             bool: True if the device was successfully deleted, False if the device
-            does not exist or an error occurs.
+            does not exist or a database error occurs.
 
         Note:
             - Foreign key cascade constraints are responsible for removing all
@@ -338,19 +636,18 @@ class SQLiteDBClient:
             - Transaction commit or rollback must be handled by the caller.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         try:
 
             # Delete the device (other tables will be cascade deleted due to foreign key)
-            async with conn.execute("DELETE FROM devices WHERE id = ?", (device_id,)) as cursor:
-                if cursor.rowcount == 0:
+            async with conn.execute(DELETE_DEVICE_SQL, (device_id,)) as cursor:
+                if await cursor.fetchone() is None:
                     logger.warning(f"No energy meter found with ID {device_id}")
                     return False
 
             return True
 
-        except Exception as e:
+        except aiosqlite.Error as e:
+            logger.error(f"Database error while trying to delete device with id {device_id}: {e}")
             return False
 
     async def get_all_energy_meters(self) -> List[EnergyMeterRecord]:
@@ -361,55 +658,50 @@ class SQLiteDBClient:
             List[EnergyMeterRecord]: A list of fully populated energy meter records.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-
         meters: List[EnergyMeterRecord] = []
-        conn = self.require_client()
-
-        try:
-            async with conn.execute(
-                """
-                SELECT id, name, protocol, device_type, meter_options, communication_options
-                FROM devices
-            """
-            ) as cursor:
-                device_rows = await cursor.fetchall()
-
-            for device_row in device_rows:
-                (
-                    device_id,
-                    name,
-                    protocol,
-                    device_type,
-                    meter_opts_json,
-                    comm_opts_json,
-                ) = device_row
-
-                async with conn.execute(
-                    """
-                    SELECT name, protocol, config, protocol_options, attributes FROM nodes WHERE device_id = ?
-                """,
-                    (device_id,),
-                ) as cursor:
-                    node_rows = await cursor.fetchall()
-
-                nodes: Set[NodeRecord] = set()
-                for node_name, node_protocol, config_json, protocol_options_json, attributes_json in node_rows:
-                    config: Dict[str, Any] = json.loads(config_json)
-                    protocol_options: Dict[str, Any] = json.loads(protocol_options_json)
-                    attributes: Dict[str, Any] = json.loads(attributes_json)
-                    nodes.add(
-                        ProtocolRegistry.get_protocol_plugin(node_protocol).node_record_factory(
-                            node_name, node_protocol, config, protocol_options, attributes
-                        )
-                    )
-
-                meter_opts: Dict[str, Any] = json.loads(meter_opts_json)
-                comm_opts: Dict[str, Any] = json.loads(comm_opts_json)
+        node_factories: Dict[str, NodeRecordFactory] = {}  # Registry lookups resolved once per protocol
+        meter_factories: Dict[str, MeterRecordFactory] = {}
+
+        def build_node(node_row: Tuple[Any, ...]) -> NodeRecord:
+            node_name, node_protocol, config_json, protocol_options_json, attributes_json = node_row
+            config: Dict[str, Any] = json_loads(config_json)
+            protocol_options: Dict[str, Any] = json_loads(protocol_options_json)
+            attributes: Dict[str, Any] = json_loads(attributes_json)
+            node_factory = node_factories.get(node_protocol)
+            if node_factory is None:
+                node_factory = ProtocolRegistry.get_protocol_plugin(node_protocol).node_record_factory
+                node_factories[node_protocol] = node_factory
+            return node_factory(node_name, node_protocol, config, protocol_options, attributes)
+
+        def build_meter(device_row: Tuple[Any, ...], nodes: List[NodeRecord]) -> EnergyMeterRecord:
+            device_id, name, protocol, device_type, meter_opts_json, comm_opts_json = device_row
+            meter_opts: Dict[str, Any] = json_loads(meter_opts_json)
+            comm_opts: Dict[str, Any] = json_loads(comm_opts_json)
+            meter_factory = meter_factories.get(protocol)
+            if meter_factory is None:
                 meter_factory = ProtocolRegistry.get_protocol_plugin(protocol).meter_record_factory
                 if meter_factory is None:
                     raise RuntimeError(f"No meter record factory registered for protocol {protocol}.")
-                meters.append(meter_factory(device_id, name, protocol, device_type, meter_opts, comm_opts, nodes))
+                meter_factories[protocol] = meter_factory
+            return meter_factory(device_id, name, protocol, device_type, meter_opts, comm_opts, nodes)
+
+        try:
+            async with self.reader() as conn, conn.execute(SELECT_ENERGY_METERS_SQL) as cursor:
+                device_row: Optional[Tuple[Any, ...]] = None
+                nodes: List[NodeRecord] = []
+
+                # Stream the joined rows in chunks, closing a meter whenever the device id changes
+                while rows := await cursor.fetchmany(FETCH_CHUNK_SIZE):
+                    for row in rows:
+                        if device_row is None or row[0] != device_row[0]:
+                            if device_row is not None:
+                                meters.append(build_meter(device_row, nodes))
+                            device_row, nodes = row[:6], []
+                        if row[6] is not None:  # Devices without nodes yield a single row of NULL node columns
+                            nodes.append(build_node(row[6:]))
+
+                if device_row is not None:
+                    meters.append(build_meter(device_row, nodes))
 
         except Exception as e:
             logger.exception(f"Failed to retrieve energy meters: {e}")
@@ -420,6 +712,9 @@ class SQLiteDBClient:
         """
         Updates device last seen timestamp.
 
+        Runs in its own write transaction, so it waits for any device transaction in
+        progress on the shared writer connection instead of committing it early.
+
         Args:
             device_id (int): Device identifier
 
@@ -427,27 +722,83 @@ class SQLiteDBClient:
             bool: True if successful, False otherwise
         """
 
-        logger = LoggerManager.get_logger(__name__)
-        conn = self.require_client()
-
         try:
-            await conn.execute(
-                """
-                INSERT INTO device_status (device_id, last_seen)
-                VALUES (?, CURRENT_TIMESTAMP)
-                ON CONFLICT(device_id) DO UPDATE SET
-                last_seen = CURRENT_TIMESTAMP
-                """,
-                (device_id,),
-            )
+            async with self.transaction() as conn:
+                # The status row almost always exists, so try the in-place update first
+                timestamp = get_status_timestamp()
+                async with conn.execute(UPDATE_LAST_SEEN_SQL, (timestamp, device_id)) as cursor:
+                    updated = cursor.rowcount > 0
+
+                if not updated:
+                    await conn.execute(INSERT_LAST_SEEN_SQL, (device_id, timestamp, timestamp))
 
-            await conn.commit()
             return True
 
         except Exception as e:
             logger.exception(f"Failed to update last seen timestamp for device {device_id}: {e}")
             return False
 
+    async def queue_device_last_seen(self, device_id: int) -> bool:
+        """
+        Queues a last seen update for a device, to be written by the next batch flush.
+
+        Used by the polling loops instead of update_device_last_seen, so each device poll
+        does not cost its own commit. Repeated updates within one flush interval collapse
+        into a single row write.
+
+        Args:
+            device_id (int): Device identifier
+
+        Returns:
+            bool: Always True, the update is persisted asynchronously.
+        """
+
+        self.pending_last_seen[device_id] = get_status_timestamp()
+        return True
+
+    async def flush_last_seen(self) -> bool:
+        """
+        Writes all queued last seen updates in a single transaction.
+
+        Only existing status rows are updated, so queued updates for devices deleted in the
+        meantime are dropped. If the flush fails or is cancelled, the updates are queued again
+        unless a newer timestamp arrived for the same device.
+
+        Returns:
+            bool: True if successful (or nothing was queued), False otherwise
+        """
+
+        if not self.pending_last_seen:
+            return True
+
+        pending, self.pending_last_seen = self.pending_last_seen, {}
+        flushed = False
+
+        try:
+            async with self.transaction() as conn:
+                rows = [(timestamp, device_id) for device_id, timestamp in pending.items()]
+                await conn.executemany(UPDATE_LAST_SEEN_SQL, rows)
+            flushed = True
+            return True
+
+        except Exception as e:
+            logger.exception(f"Failed to flush last seen timestamps for {len(pending)} devices: {e}")
+            return False
+
+        finally:
+            if not flushed:  # Also reached on cancellation, so no update is lost at shutdown
+                for device_id, timestamp in pending.items():
+                    self.pending_last_seen.setdefault(device_id, timestamp)
+
+    async def last_seen_writer(self) -> None:
+        """
+        Background task that flushes queued last seen updates every LAST_SEEN_FLUSH_INTERVAL seconds.
+        """
+
+        while True:
+            await asyncio.sleep(LAST_SEEN_FLUSH_INTERVAL)
+            await self.flush_last_seen()
+
     async def get_device_history(self, device_id: int) -> DeviceHistoryStatus:
         """
         Retrieves the connection history and status timestamps for a device.
@@ -459,18 +810,8 @@ class SQLiteDBClient:
             DeviceHistoryStatus: Object containing last seen timestamp and record lifecycle info
         """
 
-        logger = LoggerManager.get_logger(__name__)
-        conn = self.require_client()
-
         try:
-            async with conn.execute(
-                """
-                SELECT last_seen, created_at, updated_at
-                FROM device_status
-                WHERE device_id = ?
-                """,
-                (device_id,),
-            ) as cursor:
+            async with self.reader() as conn, conn.execute(SELECT_DEVICE_HISTORY_SQL, (device_id,)) as cursor:
                 row = await cursor.fetchone()
 
             if row:
@@ -2,10 +2,11 @@
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial, lru_cache
 from influxdb import InfluxDBClient
 from influxdb.resultset import ResultSet
 from typing import List, Dict, Tuple, Any, Optional, Iterable, Iterator
-from datetime import datetime
+from datetime import datetime, tzinfo
 from dataclasses import dataclass
 from zoneinfo import ZoneInfo
 
@@ -25,6 +26,47 @@ import util.functions.calculation as calculation
 #######################################
 
 
+logger = LoggerManager.get_logger(__name__)
+
+"""UTC time zone used to render query time bounds."""
+UTC = ZoneInfo("UTC")
+
+"""HTTP connection pool size of the shared read client, matching the API executor workers."""
+READ_POOL_SIZE = 4
+
+"""Default maximum number of points gathered from the write queue into a single write batch."""
+WRITE_BATCH_SIZE = 5000
+
+"""Default time (in seconds) to keep gathering queued measurements after the first one of a batch arrives."""
+WRITE_BATCH_TIMEOUT = 1.0
+
+"""Measurement keys that identify a data point and are not written as plain InfluxDB fields."""
+MEASUREMENT_KEYS = frozenset(("name", "start_time", "end_time"))
+
+"""Maximum number of distinct datetimes kept by the cached date formatters."""
+DATE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def get_iso_minutes(date_time: datetime, tz_info: Optional[tzinfo]) -> str:
+    """
+    Cached version of `date.to_iso_minutes()`.
+
+    Logged points and time buckets share a small set of minute boundaries, so the formatted
+    strings are reused. The time zone is part of the key because equal instants in different
+    zones compare equal but format with different offsets.
+    """
+
+    return date.to_iso_minutes(date_time)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def get_minute_precision(date_time: datetime, tz_info: Optional[tzinfo]) -> datetime:
+    """Cached version of `date.remove_sec_precision()`, keyed by time zone like `get_iso_minutes()`."""
+
+    return date.remove_sec_precision(date_time)
+
+
 @dataclass
 class Measurement:
     """
@@ -39,6 +81,59 @@ class Measurement:
     data: List[Dict[str, Any]]
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def get_isostr_date(date_str: str) -> datetime:
+    """
+    Cached version of `date.convert_isostr_to_date()`.
+
+    Consecutive query buckets usually share their boundaries (the end time of one bucket is
+    the start time of the next), so the same ISO strings are parsed repeatedly.
+    """
+
+    return date.convert_isostr_to_date(date_str)
+
+
+@lru_cache(maxsize=64)
+def get_numeric_select_fields(unit_factor: float, is_counter: bool, aggregated: bool) -> Tuple[str, ...]:
+    """
+    Returns the SELECT fields for a numeric variable log query.
+
+    The fields only depend on the unit factor, the counter flag and the query mode, which
+    have very few combinations, so the rendered fields are cached and reused across queries.
+
+    Args:
+        unit_factor: SI prefix factor of the variable unit.
+        is_counter: Whether the variable is a counter (incremental) node.
+        aggregated: If True, returns time-bucket aggregations (SUM/MIN/MAX).
+
+    Returns:
+        Tuple[str, ...]: Rendered field expressions.
+    """
+
+    if not is_counter:
+        if aggregated:  # aggregated/bucketed
+            return (
+                'SUM("mean_sum") AS mean_sum',
+                'SUM("mean_count") AS mean_count',
+                f'(SUM("mean_sum") / SUM("mean_count")) / {unit_factor} AS average_value',
+                f'MIN("min_value") / {unit_factor} AS min_value',
+                f'MAX("max_value") / {unit_factor} AS max_value',
+            )
+        else:  # raw/non-formatted
+            return (
+                '"mean_sum" AS mean_sum',
+                '"mean_count" AS mean_count',
+                f'("mean_sum" / "mean_count") / {unit_factor} AS average_value',
+                f'"min_value" / {unit_factor} AS min_value',
+                f'"max_value" / {unit_factor} AS max_value',
+            )
+    else:  # incremental node
+        if aggregated:
+            return (f'SUM("value") / {unit_factor} AS value',)
+        else:
+            return (f'"value" / {unit_factor} AS value',)
+
+
 class TimeDBClient:
     """
     Asynchronous client interface for interacting with an InfluxDB time-series database.
@@ -60,8 +155,11 @@ class TimeDBClient:
     structured time-series data.
 
     Attributes:
-        client (InfluxDBClient): Connection to the InfluxDB server.
+        client (InfluxDBClient): Connection to the InfluxDB server used for writes.
+        read_client (InfluxDBClient): Shared connection to the InfluxDB server used for queries.
         write_queue (asyncio.Queue): Queue used for async write tasks.
+        write_batch_size (int): Maximum number of points written in a single batch.
+        write_batch_timeout (float): Time (in seconds) spent gathering measurements for a batch.
     """
 
     @staticmethod
@@ -106,19 +204,17 @@ class TimeDBClient:
         formatted = []
 
         for item in data:
-            if not all(k in item for k in ("name", "start_time", "end_time")):
+            if not MEASUREMENT_KEYS <= item.keys():
                 raise ValueError(f"Missing required fields in data item: {item}")
 
             name: str = item["name"]
             start_time: datetime = item["start_time"]
             end_time: datetime = item["end_time"]
 
-            formatted_start = date.to_iso_minutes(start_time)
-            formatted_end = date.to_iso_minutes(end_time)
+            formatted_start = get_iso_minutes(start_time, start_time.tzinfo)
+            formatted_end = get_iso_minutes(end_time, end_time.tzinfo)
 
-            fields: dict[str, Any] = {
-                k: v for k, v in item.items() if k not in ("name", "start_time", "end_time") and v is not None
-            }
+            fields: dict[str, Any] = {k: v for k, v in item.items() if v is not None and k not in MEASUREMENT_KEYS}
             fields["start_time"] = formatted_start
             fields["end_time"] = formatted_end
 
@@ -131,31 +227,47 @@ class TimeDBClient:
             else:
                 return None
 
-            formatted.append({"measurement": name, "fields": fields, "time": date.remove_sec_precision(start_time)})
+            formatted.append(
+                {"measurement": name, "fields": fields, "time": get_minute_precision(start_time, start_time.tzinfo)}
+            )
 
         return formatted
 
-    def __init__(self, host: str, port: int, username: str = "root", password: str = "root"):
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "root",
+        password: str = "root",
+        write_batch_size: int = WRITE_BATCH_SIZE,
+        write_batch_timeout: float = WRITE_BATCH_TIMEOUT,
+    ):
 
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.client: Optional[InfluxDBClient] = None
+        self.read_client: Optional[InfluxDBClient] = None
         self.write_queue: asyncio.Queue[Measurement] = asyncio.Queue(maxsize=1000)
         self.api_executor = ThreadPoolExecutor(max_workers=4)
         self.write_task: Optional[asyncio.Task] = None
+        self.write_batch_size = write_batch_size
+        self.write_batch_timeout = write_batch_timeout
 
     async def init_connection(self) -> None:
         """
-        Initiates the InfluxDB main connection (writes).
+        Initiates the InfluxDB main connection (writes) and the shared read connection.
         Should be called during application initialization.
         """
 
         loop = asyncio.get_event_loop()
-        if self.client is not None or self.write_task is not None:
-            raise RuntimeError("InfluxDB main connection or write task are already instantiated")
+        if self.client is not None or self.read_client is not None or self.write_task is not None:
+            raise RuntimeError("InfluxDB connections or write task are already instantiated")
         self.client = InfluxDBClient(host=self.host, port=self.port, username=self.username, password=self.password)
+        self.read_client = InfluxDBClient(
+            host=self.host, port=self.port, username=self.username, password=self.password, pool_size=READ_POOL_SIZE
+        )
         self.write_task = loop.create_task(self.db_writer())
 
     async def close_connection(self):
@@ -164,17 +276,21 @@ class TimeDBClient:
         Should be called during application shutdown.
         """
 
-        try:
-            if self.write_task:
-                self.write_task.cancel()
+        if self.write_task:
+            self.write_task.cancel()
+            try:
                 await self.write_task
-                self.write_task = None
+            except asyncio.CancelledError:
+                pass
+            self.write_task = None
 
-            if self.client:
-                self.client.close()
-                self.client = None
-        except asyncio.CancelledError:
-            pass
+        if self.client:
+            self.client.close()
+            self.client = None
+
+        if self.read_client:
+            self.read_client.close()
+            self.read_client = None
 
     def __require_main_client(self) -> InfluxDBClient:
         """
@@ -188,66 +304,112 @@ class TimeDBClient:
             raise RuntimeError(f"InfluxDB main client is not instantiated properly. ")
         return self.client
 
-    def __get_new_client(self) -> InfluxDBClient:
+    def __require_read_client(self) -> InfluxDBClient:
         """
-        Creates a new InfluxDB client instance for read/query operations.
+        Return the active InfluxDB client connection for read/query and management operations.
+
+        The client is shared by every request and its HTTP connection pool keeps connections
+        alive between queries. It never switches databases, so every query must name its
+        database explicitly.
 
-        The returned client is intended for single-use or per-request queries and must not
-        be shared across threads. Callers are responsible for closing the client after use.
+        Raises:
+            RuntimeError: If the client is not initialized.
         """
 
-        return InfluxDBClient(host=self.host, port=self.port, username=self.username, password=self.password)
+        if self.read_client is None:
+            raise RuntimeError("InfluxDB read client is not instantiated properly.")
+        return self.read_client
 
     async def db_writer(self):
         """
         Continuously processes queued measurement data and writes it to InfluxDB.
 
-        This coroutine runs indefinitely, retrieving `Measurement` objects from the `write_queue`
-        and passing them to `write_data()` for persistence in the database.
+        This coroutine runs indefinitely, waiting for a `Measurement` in the `write_queue` and then
+        gathering the ones that follow for up to `write_batch_timeout` seconds (or until
+        `write_batch_size` points are gathered), so that the whole batch is persisted by a single
+        `write_data()` call. Nodes are logged on the same minute boundaries, so their measurements
+        arrive in bursts that are written together.
 
         Notes:
             - Exceptions during processing are caught and logged without crashing the loop.
+            - A batch still being gathered when the task is cancelled is written before exiting.
         """
 
-        logger = LoggerManager.get_logger(__name__)
+        loop = asyncio.get_running_loop()
 
         while True:
+            measurements: List[Measurement] = []
             try:
-                measurement: Measurement = await self.write_queue.get()
-                await self.write_data(measurement)
+                measurements.append(await self.write_queue.get())
+                batch_size = len(measurements[0].data)
+                deadline = loop.time() + self.write_batch_timeout
+
+                while batch_size < self.write_batch_size:
+                    try:
+                        measurement = self.write_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            measurement = await asyncio.wait_for(self.write_queue.get(), timeout=remaining)
+                        except asyncio.TimeoutError:
+                            break
+                    measurements.append(measurement)
+                    batch_size += len(measurement.data)
+
+                await self.write_data(measurements)
+
+            except asyncio.CancelledError:
+                if measurements:
+                    await self.write_data(measurements)
+                raise
 
             except Exception as e:
                 logger.exception(f"Write Task: {e}")
 
-            await asyncio.sleep(0)
-
-    async def write_data(self, measurement: Measurement) -> bool:
+    async def write_data(self, measurements: List[Measurement]) -> bool:
         """
-        Writes a single measurement batch to InfluxDB.
+        Writes a batch of measurements to InfluxDB.
 
-        This method formats the data using `to_db_format()`, and then writes it.
+        Each measurement is formatted using `to_db_format()` and its points are grouped by
+        database, so that every database receives a single write request for the whole batch.
+        The blocking HTTP writes run in the API executor to keep the event loop responsive.
+        A measurement that fails to format or a database that fails to write doesn't prevent
+        the remaining ones from being persisted.
 
         Args:
-            measurement (Measurement): A dataclass containing the database name and a list of data points.
+            measurements (List[Measurement]): Dataclasses containing the database name and a list of data points.
 
         Returns:
-            bool: True if the write was successful, False if an error occurred.
+            bool: True if all writes were successful, False if an error occurred.
         """
 
-        logger = LoggerManager.get_logger(__name__)
         client = self.__require_main_client()
+        loop = asyncio.get_running_loop()
+        success = True
+        db_points: Dict[str, List[Dict[str, Any]]] = {}
 
-        try:
-            db_data = TimeDBClient.to_db_format(measurement.data)
+        for measurement in measurements:
+            try:
+                db_data = TimeDBClient.to_db_format(measurement.data)
+            except Exception as e:
+                logger.exception(f"Failed to format data for DB '{measurement.db}': {e}")
+                success = False
+                continue
 
             if db_data:
-                client.write_points(points=db_data, database=measurement.db)
+                db_points.setdefault(measurement.db, []).extend(db_data)
 
-            return True
+        for db, points in db_points.items():
+            try:
+                write = partial(client.write_points, points=points, database=db, batch_size=self.write_batch_size)
+                await loop.run_in_executor(self.api_executor, write)
+            except Exception as e:
+                logger.exception(f"Failed to write data to DB '{db}': {e}")
+                success = False
 
-        except Exception as e:
-            logger.exception(f"Failed to write data to DB '{measurement.db}': {e}")
-            return False
+        return success
 
     def __iter_points(self, res: ResultSet | Iterable[ResultSet]) -> Iterator[Dict[str, Any]]:
         """
@@ -294,36 +456,11 @@ class TimeDBClient:
         """
 
         if isinstance(variable.processor, NumericNodeProcessor):
-            unit_factor = f"{calculation.get_unit_factor(variable.config.unit)}"
+            unit_factor = calculation.get_unit_factor(variable.config.unit)
 
             if not variable.config.is_counter:
                 query.where.append('"mean_count" > 0')
-                if aggregated:  # aggregated/bucketed
-                    query.fields.extend(
-                        [
-                            f'SUM("mean_sum") AS mean_sum',
-                            f'SUM("mean_count") AS mean_count',
-                            f'(SUM("mean_sum") / SUM("mean_count")) / {unit_factor} AS average_value',
-                            f'MIN("min_value") / {unit_factor} AS min_value',
-                            f'MAX("max_value") / {unit_factor} AS max_value',
-                        ]
-                    )
-                else:  # raw/non-formatted
-                    query.fields.extend(
-                        [
-                            f'"mean_sum" AS mean_sum',
-                            f'"mean_count" AS mean_count',
-                            f'("mean_sum" / "mean_count") / {unit_factor} AS average_value',
-                            f'"min_value" / {unit_factor} AS min_value',
-                            f'"max_value" / {unit_factor} AS max_value',
-                        ]
-                    )
-            else:  # incremental node
-                if aggregated:
-                    query.fields.extend([f'SUM("value") / {unit_factor} AS value'])
-
-                else:
-                    query.fields.extend([f'"value" / {unit_factor} AS value'])
+            query.fields.extend(get_numeric_select_fields(unit_factor, variable.config.is_counter, aggregated))
         else:
             if aggregated:
                 raise NotImplementedError("Can't get logs from non-numeric variables in formatted time spans")
@@ -469,8 +606,8 @@ class TimeDBClient:
         """
 
         if start_time and end_time:
-            start_time_str = start_time.astimezone(ZoneInfo("UTC")).isoformat().replace("+00:00", "Z")
-            end_time_str = end_time.astimezone(ZoneInfo("UTC")).isoformat().replace("+00:00", "Z")
+            start_time_str = start_time.astimezone(UTC).isoformat().replace("+00:00", "Z")
+            end_time_str = end_time.astimezone(UTC).isoformat().replace("+00:00", "Z")
             query = self.__build_query_with_time_span(
                 variable, start_time_str, end_time_str, aggregated, group_by_time, time_zone
             )
@@ -480,37 +617,30 @@ class TimeDBClient:
 
         return query
 
-    def __get_non_empty_points(self, points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def __get_non_empty_points(
+        self, points: List[Dict[str, Any]], time_step: FormattedTimeStep
+    ) -> Tuple[List[Dict[str, Any]], FormattedTimeStep]:
         """
-        Filters points with valid start_time and end_time and parses them into datetime objects.
+        Filters points with valid start_time and end_time, parses them into datetime objects and
+        determines the largest required time step, all in a single pass over the points.
 
-        Returns a new list containing only points with non-null timestamps; timestamp fields
-        are converted in-place from ISO strings to datetime objects.
+        Returns a new list containing only points with non-null timestamps (timestamp fields
+        are converted in-place from ISO strings to datetime objects), along with the largest
+        time step needed to fully accommodate all point intervals.
         """
 
         valid_points: List[Dict[str, Any]] = []
 
         for point in points:
             if point["start_time"] is not None and point["end_time"] is not None:
-                point["start_time"] = date.convert_isostr_to_date(point["start_time"])
-                point["end_time"] = date.convert_isostr_to_date(point["end_time"])
+                point["start_time"] = get_isostr_date(point["start_time"])
+                point["end_time"] = get_isostr_date(point["end_time"])
                 valid_points.append(point)
 
-        return valid_points
-
-    def __adjust_time_step(self, points: List[Dict[str, Any]], time_step: FormattedTimeStep) -> FormattedTimeStep:
-        """
-        Determines the largest required time step based on the durations of the given points.
-
-        Iterates over points with pre-parsed datetime start_time and end_time fields and
-        returns the largest time step needed to fully accommodate all point intervals.
-        """
+                current_time_step = date.get_formatted_time_step(point["start_time"], point["end_time"], inclusive=True)
+                time_step = date.bigger_time_step(time_step, current_time_step)
 
-        for point in points:
-            current_time_step = date.get_formatted_time_step(point["start_time"], point["end_time"], inclusive=True)
-            time_step = date.bigger_time_step(time_step, current_time_step)
-
-        return time_step
+        return (valid_points, time_step)
 
     def __align_points_start_time(
         self, variable: Node, points: List[Dict[str, Any]], aligned_time_buckets: List[Tuple[datetime, datetime]]
@@ -528,9 +658,10 @@ class TimeDBClient:
 
         unit_factor = calculation.get_unit_factor(variable.config.unit)
         existing_data: Dict[datetime, Dict[str, Any]] = {}
+        bucket_starts = [bucket_start for bucket_start, _ in aligned_time_buckets]
 
         for point in points:
-            bucket_start = date.find_bucket_for_time(point["start_time"], aligned_time_buckets)
+            bucket_start = date.find_bucket_for_time(point["start_time"], aligned_time_buckets, bucket_starts)
             if bucket_start not in existing_data:
                 existing_data[bucket_start] = point
             else:
@@ -578,23 +709,26 @@ class TimeDBClient:
 
         output: List[Dict[str, Any]] = []
         for bucket_start, bucket_end in aligned_time_buckets:
+            formatted_start = get_iso_minutes(bucket_start, bucket_start.tzinfo)
+            formatted_end = get_iso_minutes(bucket_end, bucket_end.tzinfo)
+
             if bucket_start in existing_data:
                 point = existing_data[bucket_start]
-                point["start_time"] = date.to_iso_minutes(bucket_start)
-                point["end_time"] = date.to_iso_minutes(bucket_end)
+                point["start_time"] = formatted_start
+                point["end_time"] = formatted_end
             else:
                 if not variable.config.is_counter:
                     point = {
-                        "start_time": date.to_iso_minutes(bucket_start),
-                        "end_time": date.to_iso_minutes(bucket_end),
+                        "start_time": formatted_start,
+                        "end_time": formatted_end,
                         "average_value": None,
                         "min_value": None,
                         "max_value": None,
                     }
                 else:
                     point = {
-                        "start_time": date.to_iso_minutes(bucket_start),
-                        "end_time": date.to_iso_minutes(bucket_end),
+                        "start_time": formatted_start,
+                        "end_time": formatted_end,
                         "value": None,
                     }
 
@@ -635,8 +769,7 @@ class TimeDBClient:
         if not isinstance(variable.processor, NumericNodeProcessor):
             return (None, points)
 
-        valid_points = self.__get_non_empty_points(points)
-        time_step = self.__adjust_time_step(valid_points, time_step)
+        (valid_points, time_step) = self.__get_non_empty_points(points, time_step)
         aligned_time_buckets = date.get_aligned_time_buckets(start_time, end_time, time_step, time_zone)
         existing_data = self.__align_points_start_time(variable, valid_points, aligned_time_buckets)
         aligned_points = self.__fill_formatted_time_buckets(variable, valid_points, aligned_time_buckets, existing_data)
@@ -678,78 +811,58 @@ class TimeDBClient:
         global_metrics: Dict[str, Any] = {}
 
         if not variable.config.is_counter:
+            decimal_places = variable.config.decimal_places
             global_mean_sum = 0
             global_mean_count = 0
             global_mean_value = None
             global_min_value = None
-            global_min_st: Optional[str] = None
-            global_min_et: Optional[str] = None
-
+            global_min_point: Optional[Dict[str, Any]] = None
             global_max_value = None
-            global_max_st: Optional[str] = None
-            global_max_et: Optional[str] = None
+            global_max_point: Optional[Dict[str, Any]] = None
 
             for point in points:
-                if point["average_value"] is not None and variable.config.decimal_places is not None:
-                    point["average_value"] = round(point["average_value"], variable.config.decimal_places)
+                average_value = point["average_value"]
+                if average_value is not None and decimal_places is not None:
+                    point["average_value"] = round(average_value, decimal_places)
 
                 global_mean_sum += point.pop("mean_sum", 0)
                 global_mean_count += point.pop("mean_count", 0)
 
-                if point["min_value"] is not None:
-                    if global_min_value is not None:
-                        if point["min_value"] < global_min_value:
-                            global_min_value = point["min_value"]
-                            global_min_st = point["start_time"]
-                            global_min_et = point["end_time"]
-
-                    else:
-                        global_min_value = point["min_value"]
-                        global_min_st = point["start_time"]
-                        global_min_et = point["end_time"]
-
-                if point["max_value"] is not None:
-                    if global_max_value is not None:
-                        if point["max_value"] > global_max_value:
-                            global_max_value = point["max_value"]
-                            global_max_st = point["start_time"]
-                            global_max_et = point["end_time"]
-
-                    else:
-                        global_max_value = point["max_value"]
-                        global_max_st = point["start_time"]
-                        global_max_et = point["end_time"]
+                # The first occurrence of the global minimum/maximum is kept
+                min_value = point["min_value"]
+                if min_value is not None and (global_min_value is None or min_value < global_min_value):
+                    global_min_value = min_value
+                    global_min_point = point
+
+                max_value = point["max_value"]
+                if max_value is not None and (global_max_value is None or max_value > global_max_value):
+                    global_max_value = max_value
+                    global_max_point = point
 
             global_mean_value = (global_mean_sum / global_mean_count) if global_mean_count != 0 else None
             if global_mean_value is not None:
                 global_mean_value /= calculation.get_unit_factor(variable.config.unit)
                 global_mean_value = (
-                    round(global_mean_value, variable.config.decimal_places)
-                    if variable.config.decimal_places is not None
-                    else global_mean_value
+                    round(global_mean_value, decimal_places) if decimal_places is not None else global_mean_value
                 )
 
             global_metrics["average_value"] = global_mean_value
             global_metrics["min_value"] = global_min_value
             global_metrics["max_value"] = global_max_value
-            global_metrics["min_value_start_time"] = global_min_st
-            global_metrics["min_value_end_time"] = global_min_et
-            global_metrics["max_value_start_time"] = global_max_st
-            global_metrics["max_value_end_time"] = global_max_et
+            global_metrics["min_value_start_time"] = global_min_point["start_time"] if global_min_point else None
+            global_metrics["min_value_end_time"] = global_min_point["end_time"] if global_min_point else None
+            global_metrics["max_value_start_time"] = global_max_point["start_time"] if global_max_point else None
+            global_metrics["max_value_end_time"] = global_max_point["end_time"] if global_max_point else None
 
         else:
-            global_sum = 0
-
-            for point in points:
-                global_sum += point["value"] if point["value"] is not None else 0
-
-            global_metrics["value"] = global_sum
+            global_metrics["value"] = sum(point["value"] for point in points if point["value"] is not None)
 
         return global_metrics
 
     def __get_formatted_variable_logs(
         self,
         client: InfluxDBClient,
+        db_name: str,
         variable: Node,
         start_time: datetime,
         end_time: datetime,
@@ -765,6 +878,7 @@ class TimeDBClient:
 
         Args:
             client: Active InfluxDB client connection.
+            db_name: Name of the device database to query.
             variable: Node configuration with variable name and processor settings.
             start_time: Start of the query time range.
             end_time: End of the query time range.
@@ -784,14 +898,14 @@ class TimeDBClient:
                     variable, st, date.calculate_date_delta(st, time_step, time_zone), True, group_by_time, time_zone
                 )
 
-                result = client.query(query)
+                result = client.query(query, database=db_name)
                 points = [{k: v for k, v in point.items() if k not in {"time"}} for point in self.__iter_points(result)]
                 variable_logs.extend(points)
         else:
             query = self.__build_query(
                 variable, start_time, end_time, True, date.time_step_grouping(start_time, time_step, time_zone), time_zone
             )
-            result = client.query(query)
+            result = client.query(query, database=db_name)
             points = [{k: v for k, v in point.items() if k not in {"time"}} for point in self.__iter_points(result)]
             variable_logs.extend(points)
 
@@ -800,6 +914,7 @@ class TimeDBClient:
     def __get_raw_variable_logs(
         self,
         client: InfluxDBClient,
+        db_name: str,
         variable: Node,
         start_time: Optional[datetime],
         end_time: Optional[datetime],
@@ -815,6 +930,7 @@ class TimeDBClient:
 
         Args:
             client: Active InfluxDB client connection.
+            db_name: Name of the device database to query.
             variable: Node configuration with variable name and processor settings.
             start_time: Optional start time for filtering (inclusive).
             end_time: Optional end time for filtering (exclusive).
@@ -826,7 +942,7 @@ class TimeDBClient:
         """
 
         query = self.__build_query(variable, start_time, end_time, force_aggregation, None, time_zone)
-        result = client.query(query)
+        result = client.query(query, database=db_name)
         return [{k: v for k, v in point.items() if k not in {"time"}} for point in self.__iter_points(result)]
 
     def get_variable_logs(
@@ -871,58 +987,55 @@ class TimeDBClient:
         Raises:
             ValueError: If only one of `start_time` or `end_time` is provided, or if `end_time`
                         is not after `start_time`.
+            RuntimeError: If called before `init_connection()`, as the shared read client is used.
         """
 
-        client = self.__get_new_client()
-        try:
-            db_name = f"{device_name}_{device_id}"
-
-            if (time_span.start_time and not time_span.end_time) or (time_span.end_time and not time_span.start_time):
-                raise ValueError("Both 'start_time' and 'end_time' must be provided together.")
+        client = self.__require_read_client()
+        db_name = f"{device_name}_{device_id}"
 
-            if time_span.start_time and time_span.end_time and time_span.end_time <= time_span.start_time:
-                raise ValueError("'end_time' must be a later date than 'start_time'.")
+        if (time_span.start_time and not time_span.end_time) or (time_span.end_time and not time_span.start_time):
+            raise ValueError("Both 'start_time' and 'end_time' must be provided together.")
 
-            client.switch_database(db_name)
-            if (
-                time_span.formatted and time_span.start_time and time_span.end_time and time_span.time_step
-            ):  # Logs are to be Formatted
+        if time_span.start_time and time_span.end_time and time_span.end_time <= time_span.start_time:
+            raise ValueError("'end_time' must be a later date than 'start_time'.")
 
-                points = self.__get_formatted_variable_logs(
-                    client, variable, time_span.start_time, time_span.end_time, time_span.time_step, time_span.time_zone
-                )
+        if (
+            time_span.formatted and time_span.start_time and time_span.end_time and time_span.time_step
+        ):  # Logs are to be Formatted
 
-            else:
-                points = self.__get_raw_variable_logs(
-                    client,
-                    variable,
-                    time_span.start_time,
-                    time_span.end_time,
-                    time_span.time_zone,
-                    time_span.force_aggregation,
-                )
+            points = self.__get_formatted_variable_logs(
+                client, db_name, variable, time_span.start_time, time_span.end_time, time_span.time_step, time_span.time_zone
+            )
 
-            if (
-                time_span.formatted and time_span.start_time and time_span.end_time and time_span.time_step
-            ):  # Apply post logs processing if logs are Formatted
-                (time_span.time_step, points) = self.__formatted_post_processing(
-                    variable, points, time_span.start_time, time_span.end_time, time_span.time_step, time_span.time_zone
-                )
-            global_metrics = self.__post_process_points(variable, points)
-
-            variable_logs = NodeLogs(
-                unit=variable.config.unit,
-                decimal_places=variable.config.decimal_places,
-                type=variable.config.type,
-                is_counter=variable.config.is_counter,
-                points=points if not remove_points else [],
-                time_step=time_span.time_step,
-                global_metrics=global_metrics,
+        else:
+            points = self.__get_raw_variable_logs(
+                client,
+                db_name,
+                variable,
+                time_span.start_time,
+                time_span.end_time,
+                time_span.time_zone,
+                time_span.force_aggregation,
             )
-            return variable_logs
 
-        finally:
-            client.close()
+        if (
+            time_span.formatted and time_span.start_time and time_span.end_time and time_span.time_step
+        ):  # Apply post logs processing if logs are Formatted
+            (time_span.time_step, points) = self.__formatted_post_processing(
+                variable, points, time_span.start_time, time_span.end_time, time_span.time_step, time_span.time_zone
+            )
+        global_metrics = self.__post_process_points(variable, points)
+
+        variable_logs = NodeLogs(
+            unit=variable.config.unit,
+            decimal_places=variable.config.decimal_places,
+            type=variable.config.type,
+            is_counter=variable.config.is_counter,
+            points=points if not remove_points else [],
+            time_step=time_span.time_step,
+            global_metrics=global_metrics,
+        )
+        return variable_logs
 
     def create_db(self, device_name: str, device_id: int) -> bool:
         """
@@ -939,10 +1052,12 @@ class TimeDBClient:
         Returns:
             bool: True if the database was created successfully, False if it already
             exists or if creation fails.
+
+        Raises:
+            RuntimeError: If called before `init_connection()`, as the shared read client is used.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-        client = self.__get_new_client()
+        client = self.__require_read_client()
 
         db_name = f"{device_name}_{device_id}"
 
@@ -955,8 +1070,6 @@ class TimeDBClient:
             return True
         except Exception as e:
             return False
-        finally:
-            client.close()
 
     def delete_variable_data(self, device_name: str, device_id: int, variable: Node) -> bool:
         """
@@ -969,10 +1082,12 @@ class TimeDBClient:
 
         Returns:
             bool: True if deletion was successful, False otherwise.
+
+        Raises:
+            RuntimeError: If called before `init_connection()`, as the shared read client is used.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-        client = self.__get_new_client()
+        client = self.__require_read_client()
 
         db_name = f"{device_name}_{device_id}"
 
@@ -980,15 +1095,12 @@ class TimeDBClient:
             if not self.check_db_exists(client, db_name):
                 return False
 
-            client.switch_database(db_name)
-            client.query(f'DELETE FROM "{variable.config.name}"')
+            client.query(f'DELETE FROM "{variable.config.name}"', database=db_name)
             return True
 
         except Exception as e:
             logger.warning(f"Failed to delete measurement '{variable.config.name}' from DB '{db_name}': {e}")
             return False
-        finally:
-            client.close()
 
     def delete_all_data(self, device_name: str, device_id: int) -> bool:
         """
@@ -1003,10 +1115,12 @@ class TimeDBClient:
 
         Returns:
             bool: True if data was deleted successfully, False otherwise.
+
+        Raises:
+            RuntimeError: If called before `init_connection()`, as the shared read client is used.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-        client = self.__get_new_client()
+        client = self.__require_read_client()
 
         db_name = f"{device_name}_{device_id}"
 
@@ -1014,15 +1128,12 @@ class TimeDBClient:
             if not self.check_db_exists(client, db_name):
                 return False
 
-            client.switch_database(db_name)
-            client.query(f"DROP SERIES FROM /.*/")
+            client.query(f"DROP SERIES FROM /.*/", database=db_name)
             return True
 
         except Exception as e:
             logger.warning(f"Failed to delete all measurements from DB '{db_name}': {e}")
             return False
-        finally:
-            client.close()
 
     def delete_db(self, device_name: str, device_id: int) -> bool:
         """
@@ -1037,10 +1148,12 @@ class TimeDBClient:
 
         Returns:
             bool: True if the database was successfully deleted, False otherwise.
+
+        Raises:
+            RuntimeError: If called before `init_connection()`, as the shared read client is used.
         """
 
-        logger = LoggerManager.get_logger(__name__)
-        client = self.__get_new_client()
+        client = self.__require_read_client()
 
         db_name = f"{device_name}_{device_id}"
 
@@ -1053,8 +1166,6 @@ class TimeDBClient:
         except Exception as e:
             logger.exception(f"Failed to delete DB '{db_name}': {e}")
             return False
-        finally:
-            client.close()
 
     def check_db_exists(self, client: InfluxDBClient, db: str) -> bool:
         """
@@ -15,7 +15,7 @@ from web.server import HTTPServer
 from util.debug import LoggerManager
 from analytics.system import SystemMonitor
 
-# from meter_models.meters import get_orno_we_516_db, get_sm1238_db
+# from meter_models.meters import get_meter
 
 #######################################
 
@@ -53,8 +53,8 @@ async def async_main():
         # Create core infrastructure
         await timedb_client.init_connection()
         await sqlitedb_client.init_connection()
-        # sqlitedb_client.insert_energy_meter(get_orno_we_516_db())
-        # sqlitedb_client.insert_energy_meter(get_sm1238_db())
+        # sqlitedb_client.insert_energy_meter(get_meter("orno_we_516"))
+        # sqlitedb_client.insert_energy_meter(get_meter("sm1238"))
         await device_manager.start()
         await mqtt_client.start()
         await http_server.start()
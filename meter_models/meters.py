@@ -1,6 +1,6 @@
 ###########EXERTNAL IMPORTS############
 
-from typing import Set
+from typing import Callable, Dict, List, Optional, Tuple
 
 #######################################
 
@@ -8,8 +8,8 @@ from typing import Set
 
 from controller.node.node import Node
 from model.controller.general import Protocol
-from model.controller.device import EnergyMeterRecord, EnergyMeterType, EnergyMeterOptions
-from model.controller.node import NodeRecord, NodeConfig, NodeAttributes, NodePhase, NodeType, CounterMode
+from model.controller.device import EnergyMeterRecord, EnergyMeterType, EnergyMeterOptions, BaseCommunicationOptions
+from model.controller.node import NodeConfig, NodeAttributes, NodePhase, NodeType, CounterMode
 from model.controller.protocol.no_protocol import NoProtocolNodeOptions, NoProtocolType
 from model.controller.protocol.modbus_rtu import ModbusRTUNodeOptions, ModbusRTUNodeType, ModbusRTUNodeMode, ModbusRTUFunction
 from model.controller.protocol.opc_ua import OPCUANodeOptions, OPCUANodeType
@@ -18,722 +18,262 @@ from controller.meter.protocol.opcua.opcua_device import OPCUAOptions, OPCUANode
 
 #######################################
 
+"""Measurement units shared by the predefined meter node definitions."""
+UNIT_NONE = ""
+UNIT_V = "V"
+UNIT_MA = "mA"
+UNIT_A = "A"
+UNIT_W = "W"
+UNIT_KW = "kW"
+UNIT_VAR = "VAr"
+UNIT_KVAR = "kVAr"
+UNIT_VA = "VA"
+UNIT_KVA = "kVA"
+UNIT_KWH = "kWh"
+UNIT_KVARH = "kVArh"
+UNIT_HZ = "Hz"
 
-def get_orno_we_516_db() -> EnergyMeterRecord:
-    meter_options = EnergyMeterOptions()
-    communication_options = ModbusRTUOptions(
-        slave_id=1, port="/dev/ttyAMA0", baudrate=9600, stopbits=1, parity="E", bytesize=8, read_period=5, timeout=1, retries=0
-    )
 
-    def cfg(name: str, unit: str, phase: NodePhase, logging: bool = False, logging_period: int = 15, **extra) -> NodeConfig:
-        protocol = Protocol.MODBUS_RTU if not extra.get("calculated", None) else Protocol.NONE
-        return NodeConfig(
-            name=name,
-            unit=unit,
-            type=NodeType.FLOAT,
-            protocol=protocol,
-            logging=logging,
-            logging_period=logging_period,
-            attributes=NodeAttributes(phase=phase),
-            **extra
-        )
+"""
+Definition of a single meter node: (name, unit, phase, source, logging_period, counter_mode, poll_period).
 
-    nodes: Set[Node] = set()
+The source is the protocol address of the node (Modbus register or numeric OPC UA identifier),
+or None for nodes calculated by the application. A logging period of None disables logging, and a
+counter mode of None marks the node as a non-counter measurement. A poll period of None reads
+the node on every device read cycle.
+"""
+NodeSpec = Tuple[str, str, NodePhase, Optional[int], Optional[int], Optional[CounterMode], Optional[int]]
 
-    # L1
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_voltage", "V", phase=NodePhase.L1, logging=True, logging_period=1),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x000E,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_current", "A", phase=NodePhase.L1),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0016,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_active_power", "kW", phase=NodePhase.L1),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x001E,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_reactive_power", "kVAr", phase=NodePhase.L1),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0026,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
 
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_forward_active_energy", "kWh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x010A,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_reverse_active_energy", "kWh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0112,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_forward_reactive_energy", "kVArh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0122,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l1_reverse_reactive_energy", "kVArh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x012A,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
+"""Poll period in seconds of slowly changing energy counter registers."""
+ENERGY_POLL_PERIOD = 30
 
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l1_active_energy", "kWh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.CUMULATIVE, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l1_reactive_energy", "kVArh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.CUMULATIVE, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-
-    nodes.add(
-        Node(
-            configuration=cfg("l1_apparent_power", "kVA", phase=NodePhase.L1, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("l1_power_factor", "", phase=NodePhase.L1, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
 
+"""Node definitions of the ORNO OR-WE-516 three-phase meter, read over Modbus RTU holding registers."""
+ORNO_WE_516_SPEC: Tuple[NodeSpec, ...] = (
+    # L1
+    ("l1_voltage", UNIT_V, NodePhase.L1, 0x000E, 1, None, None),
+    ("l1_current", UNIT_A, NodePhase.L1, 0x0016, None, None, None),
+    ("l1_active_power", UNIT_KW, NodePhase.L1, 0x001E, None, None, None),
+    ("l1_reactive_power", UNIT_KVAR, NodePhase.L1, 0x0026, None, None, None),
+    ("l1_forward_active_energy", UNIT_KWH, NodePhase.L1, 0x010A, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l1_reverse_active_energy", UNIT_KWH, NodePhase.L1, 0x0112, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l1_forward_reactive_energy", UNIT_KVARH, NodePhase.L1, 0x0122, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l1_reverse_reactive_energy", UNIT_KVARH, NodePhase.L1, 0x012A, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l1_active_energy", UNIT_KWH, NodePhase.L1, None, None, CounterMode.CUMULATIVE, None),
+    ("l1_reactive_energy", UNIT_KVARH, NodePhase.L1, None, None, CounterMode.CUMULATIVE, None),
+    ("l1_apparent_power", UNIT_KVA, NodePhase.L1, None, None, None, None),
+    ("l1_power_factor", UNIT_NONE, NodePhase.L1, None, None, None, None),
     # L2
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_voltage", "V", phase=NodePhase.L2, logging=True, logging_period=1),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0010,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_current", "A", phase=NodePhase.L2),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0018,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_active_power", "kW", phase=NodePhase.L2),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0020,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_reactive_power", "kVAr", phase=NodePhase.L2),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0028,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_forward_active_energy", "kWh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x010C,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_reverse_active_energy", "kWh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0114,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_forward_reactive_energy", "kVArh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0124,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l2_reverse_reactive_energy", "kVArh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x012C,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l2_active_energy", "kWh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.CUMULATIVE, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l2_reactive_energy", "kVArh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.CUMULATIVE, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-
-    nodes.add(
-        Node(
-            configuration=cfg("l2_apparent_power", "kVA", phase=NodePhase.L2, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("l2_power_factor", "", phase=NodePhase.L2, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-
+    ("l2_voltage", UNIT_V, NodePhase.L2, 0x0010, 1, None, None),
+    ("l2_current", UNIT_A, NodePhase.L2, 0x0018, None, None, None),
+    ("l2_active_power", UNIT_KW, NodePhase.L2, 0x0020, None, None, None),
+    ("l2_reactive_power", UNIT_KVAR, NodePhase.L2, 0x0028, None, None, None),
+    ("l2_forward_active_energy", UNIT_KWH, NodePhase.L2, 0x010C, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l2_reverse_active_energy", UNIT_KWH, NodePhase.L2, 0x0114, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l2_forward_reactive_energy", UNIT_KVARH, NodePhase.L2, 0x0124, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l2_reverse_reactive_energy", UNIT_KVARH, NodePhase.L2, 0x012C, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l2_active_energy", UNIT_KWH, NodePhase.L2, None, None, CounterMode.CUMULATIVE, None),
+    ("l2_reactive_energy", UNIT_KVARH, NodePhase.L2, None, None, CounterMode.CUMULATIVE, None),
+    ("l2_apparent_power", UNIT_KVA, NodePhase.L2, None, None, None, None),
+    ("l2_power_factor", UNIT_NONE, NodePhase.L2, None, None, None, None),
     # L3
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_voltage", "V", phase=NodePhase.L3, logging=True, logging_period=1),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0012,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_current", "A", phase=NodePhase.L3),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x001A,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_active_power", "kW", phase=NodePhase.L3),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0022,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_reactive_power", "kVAr", phase=NodePhase.L3),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x002A,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
+    ("l3_voltage", UNIT_V, NodePhase.L3, 0x0012, 1, None, None),
+    ("l3_current", UNIT_A, NodePhase.L3, 0x001A, None, None, None),
+    ("l3_active_power", UNIT_KW, NodePhase.L3, 0x0022, None, None, None),
+    ("l3_reactive_power", UNIT_KVAR, NodePhase.L3, 0x002A, None, None, None),
+    ("l3_forward_active_energy", UNIT_KWH, NodePhase.L3, 0x010E, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l3_reverse_active_energy", UNIT_KWH, NodePhase.L3, 0x0116, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l3_forward_reactive_energy", UNIT_KVARH, NodePhase.L3, 0x0126, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l3_reverse_reactive_energy", UNIT_KVARH, NodePhase.L3, 0x012E, None, CounterMode.DIRECT, ENERGY_POLL_PERIOD),
+    ("l3_active_energy", UNIT_KWH, NodePhase.L3, None, None, CounterMode.CUMULATIVE, None),
+    ("l3_reactive_energy", UNIT_KVARH, NodePhase.L3, None, None, CounterMode.CUMULATIVE, None),
+    ("l3_apparent_power", UNIT_KVA, NodePhase.L3, None, None, None, None),
+    ("l3_power_factor", UNIT_NONE, NodePhase.L3, None, None, None, None),
+    # Total
+    ("total_active_energy", UNIT_KWH, NodePhase.TOTAL, None, None, CounterMode.CUMULATIVE, None),
+    ("total_reactive_energy", UNIT_KVARH, NodePhase.TOTAL, None, None, CounterMode.CUMULATIVE, None),
+    ("total_power_factor", UNIT_NONE, NodePhase.TOTAL, None, None, None, None),
+    ("total_active_power", UNIT_KW, NodePhase.TOTAL, None, None, None, None),
+    ("total_reactive_power", UNIT_KVAR, NodePhase.TOTAL, None, None, None, None),
+    ("total_apparent_power", UNIT_KVA, NodePhase.TOTAL, None, None, None, None),
+    # General
+    ("frequency", UNIT_HZ, NodePhase.GENERAL, 0x0014, 1, None, None),
+)
 
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_forward_active_energy", "kWh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x010E,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_reverse_active_energy", "kWh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0116,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_forward_reactive_energy", "kVArh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0126,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("l3_reverse_reactive_energy", "kVArh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.DIRECT),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x012E,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
-        )
-    )
 
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l3_active_energy", "kWh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.CUMULATIVE, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l3_reactive_energy", "kVArh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.CUMULATIVE, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
+"""OPC UA namespace index of the SM1238 node identifiers."""
+SM1238_NAMESPACE = 4
 
-    nodes.add(
-        Node(
-            configuration=cfg("l3_apparent_power", "kVA", phase=NodePhase.L3, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("l3_power_factor", "", phase=NodePhase.L3, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
 
+"""Node definitions of the SM1238 meter exposed by a Siemens S7-1200 OPC UA server."""
+SM1238_SPEC: Tuple[NodeSpec, ...] = (
+    # L1
+    ("l1_voltage", UNIT_V, NodePhase.L1, 7, 15, None, None),
+    ("l1_current", UNIT_MA, NodePhase.L1, 6, None, None, None),
+    ("l1_active_power", UNIT_W, NodePhase.L1, 8, None, None, None),
+    ("l1_reactive_power", UNIT_VAR, NodePhase.L1, 9, None, None, None),
+    ("l1_apparent_power", UNIT_VA, NodePhase.L1, 10, None, None, None),
+    ("l1_power_factor", UNIT_NONE, NodePhase.L1, 11, None, None, None),
+    ("l1_active_energy", UNIT_KWH, NodePhase.L1, None, None, CounterMode.DELTA, None),
+    ("l1_reactive_energy", UNIT_KVARH, NodePhase.L1, None, None, CounterMode.DELTA, None),
+    # L2
+    ("l2_voltage", UNIT_V, NodePhase.L2, 14, 15, None, None),
+    ("l2_current", UNIT_MA, NodePhase.L2, 13, None, None, None),
+    ("l2_active_power", UNIT_W, NodePhase.L2, 15, None, None, None),
+    ("l2_reactive_power", UNIT_VAR, NodePhase.L2, 16, None, None, None),
+    ("l2_apparent_power", UNIT_VA, NodePhase.L2, 17, None, None, None),
+    ("l2_power_factor", UNIT_NONE, NodePhase.L2, 18, None, None, None),
+    ("l2_active_energy", UNIT_KWH, NodePhase.L2, None, None, CounterMode.DELTA, None),
+    ("l2_reactive_energy", UNIT_KVARH, NodePhase.L2, None, None, CounterMode.DELTA, None),
+    # L3
+    ("l3_voltage", UNIT_V, NodePhase.L3, 21, 15, None, None),
+    ("l3_current", UNIT_MA, NodePhase.L3, 20, None, None, None),
+    ("l3_active_power", UNIT_W, NodePhase.L3, 22, None, None, None),
+    ("l3_reactive_power", UNIT_VAR, NodePhase.L3, 23, None, None, None),
+    ("l3_apparent_power", UNIT_VA, NodePhase.L3, 24, None, None, None),
+    ("l3_power_factor", UNIT_NONE, NodePhase.L3, 25, None, None, None),
+    ("l3_active_energy", UNIT_KWH, NodePhase.L3, None, None, CounterMode.DELTA, None),
+    ("l3_reactive_energy", UNIT_KVARH, NodePhase.L3, None, None, CounterMode.DELTA, None),
     # Total
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "total_active_energy", "kWh", phase=NodePhase.TOTAL, is_counter=True, counter_mode=CounterMode.CUMULATIVE, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "total_reactive_energy",
-                "kVArh",
-                phase=NodePhase.TOTAL,
-                is_counter=True,
-                counter_mode=CounterMode.CUMULATIVE,
-                calculated=True,
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-
-    nodes.add(
-        Node(
-            configuration=cfg("total_power_factor", "", phase=NodePhase.TOTAL, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("total_active_power", "kW", phase=NodePhase.TOTAL, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("total_reactive_power", "kVAr", phase=NodePhase.TOTAL, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("total_apparent_power", "kVA", phase=NodePhase.TOTAL, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-
+    ("total_power_factor", UNIT_NONE, NodePhase.TOTAL, 29, None, None, None),
+    ("total_active_energy", UNIT_KWH, NodePhase.TOTAL, None, None, CounterMode.DELTA, None),
+    ("total_reactive_energy", UNIT_KVARH, NodePhase.TOTAL, None, None, CounterMode.DELTA, None),
+    ("total_active_power", UNIT_KW, NodePhase.TOTAL, None, None, None, None),
+    ("total_reactive_power", UNIT_KVAR, NodePhase.TOTAL, None, None, None, None),
+    ("total_apparent_power", UNIT_KVA, NodePhase.TOTAL, None, None, None, None),
     # General
-
-    nodes.add(
-        ModbusRTUNode(
-            configuration=cfg("frequency", "Hz", phase=NodePhase.GENERAL, logging=True, logging_period=1),
-            protocol_options=ModbusRTUNodeOptions(
-                function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
-                address=0x0014,
-                type=ModbusRTUNodeType.FLOAT_32,
-                endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
-            ),
+    ("frequency", UNIT_HZ, NodePhase.GENERAL, 33, None, None, None),
+    ("l1_l2_voltage", UNIT_V, NodePhase.GENERAL, 26, None, None, None),
+    ("l2_l3_voltage", UNIT_V, NodePhase.GENERAL, 27, None, None, None),
+    ("l3_l1_voltage", UNIT_V, NodePhase.GENERAL, 28, None, None, None),
+)
+
+
+def _build_from_spec(
+    name: str,
+    protocol: Protocol,
+    communication_options: BaseCommunicationOptions,
+    spec: Tuple[NodeSpec, ...],
+    namespace: int = 0,
+) -> EnergyMeterRecord:
+    """
+    Builds a three-phase energy meter record from a table of node definitions.
+
+    Nodes with a source are created as protocol nodes of the given protocol, while nodes
+    without one are created as calculated nodes. Nodes are kept in table order, so protocol
+    nodes are handed to the device in the same order in which they are declared.
+
+    Args:
+        name (str): Name of the energy meter.
+        protocol (Protocol): Communication protocol used by the meter.
+        communication_options (BaseCommunicationOptions): Protocol-specific connection settings.
+        spec (Tuple[NodeSpec, ...]): Node definitions of the meter.
+        namespace (int): OPC UA namespace index used to build the node ids of OPC UA meters.
+
+    Returns:
+        EnergyMeterRecord: Record of the meter with all of its nodes.
+
+    Raises:
+        ValueError: If the table declares the same node name more than once, or if
+            the protocol has no predefined node type.
+    """
+
+    names = [node_spec[0] for node_spec in spec]
+    if len(set(names)) != len(names):
+        duplicates = sorted({node_name for node_name in names if names.count(node_name) > 1})
+        raise ValueError(f"Duplicate node names in meter {name}: {', '.join(duplicates)}")
+
+    nodes: List[Node] = []
+
+    for node_name, unit, phase, source, logging_period, counter_mode, poll_period in spec:
+        configuration = NodeConfig(
+            name=node_name,
+            type=NodeType.FLOAT,
+            unit=unit,
+            protocol=protocol if source is not None else Protocol.NONE,
+            is_counter=counter_mode is not None,
+            counter_mode=counter_mode,
+            calculated=source is None,
+            logging=logging_period is not None,
+            logging_period=logging_period or 15,
+            attributes=NodeAttributes(phase=phase),
         )
-    )
 
-    node_records: set[NodeRecord] = {node.get_node_record() for node in nodes}
+        if source is None:
+            nodes.append(Node(configuration=configuration, protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT)))
+        elif protocol is Protocol.MODBUS_RTU:
+            nodes.append(
+                ModbusRTUNode(
+                    configuration=configuration,
+                    protocol_options=ModbusRTUNodeOptions(
+                        function=ModbusRTUFunction.READ_HOLDING_REGISTERS,
+                        address=source,
+                        type=ModbusRTUNodeType.FLOAT_32,
+                        endian_mode=ModbusRTUNodeMode.BIG_ENDIAN,
+                        poll_period=poll_period,
+                    ),
+                )
+            )
+        elif protocol is Protocol.OPC_UA:
+            nodes.append(
+                OPCUANode(
+                    configuration=configuration,
+                    protocol_options=OPCUANodeOptions(
+                        node_id=f"ns={namespace};i={source}", type=OPCUANodeType.FLOAT, poll_period=poll_period
+                    ),
+                )
+            )
+        else:
+            raise ValueError(f"Unsupported protocol for predefined meters: {protocol}")
 
     return EnergyMeterRecord(
-        name="OR-WE-516 Energy Meter",
-        protocol=Protocol.MODBUS_RTU,
+        name=name,
+        protocol=protocol,
         type=EnergyMeterType.THREE_PHASE,
-        options=meter_options,
+        options=EnergyMeterOptions(),
         communication_options=communication_options,
-        nodes=node_records,
+        nodes=list(map(Node.get_node_record, nodes)),
     )
 
 
-def get_sm1238_db() -> EnergyMeterRecord:
+def _build_orno_we_516() -> EnergyMeterRecord:
+    communication_options = ModbusRTUOptions(
+        slave_id=1, port="/dev/ttyAMA0", baudrate=9600, stopbits=1, parity="E", bytesize=8, read_period=5, timeout=1, retries=0
+    )
+    return _build_from_spec("OR-WE-516 Energy Meter", Protocol.MODBUS_RTU, communication_options, ORNO_WE_516_SPEC)
+
 
-    meter_options = EnergyMeterOptions()
+def _build_sm1238() -> EnergyMeterRecord:
     communication_options = OPCUAOptions(url="opc.tcp://192.168.10.10:4840")
+    return _build_from_spec("SM1238 S7-1200 Meter", Protocol.OPC_UA, communication_options, SM1238_SPEC, SM1238_NAMESPACE)
 
-    def cfg(name: str, unit: str, phase: NodePhase, logging: bool = False, logging_period: int = 15, **extra) -> NodeConfig:
-        protocol = Protocol.OPC_UA if not extra.get("calculated", None) else Protocol.NONE
-        return NodeConfig(
-            name=name,
-            protocol=protocol,
-            type=NodeType.FLOAT,
-            unit=unit,
-            logging=logging,
-            logging_period=logging_period,
-            attributes=NodeAttributes(phase=phase),
-            **extra
-        )
 
-    nodes: Set[Node] = set()
+"""Maps each predefined meter model to the function that builds its record."""
+METER_FACTORIES: Dict[str, Callable[[], EnergyMeterRecord]] = {
+    "orno_we_516": _build_orno_we_516,
+    "sm1238": _build_sm1238,
+}
 
-    # L1
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l1_voltage", "V", phase=NodePhase.L1, logging=True, logging_period=15),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=7", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l1_current", "mA", phase=NodePhase.L1),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=6", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l1_active_power", "W", phase=NodePhase.L1),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=8", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l1_reactive_power", "VAr", phase=NodePhase.L1),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=9", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l1_apparent_power", "VA", phase=NodePhase.L1),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=10", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l1_power_factor", "", phase=NodePhase.L1),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=11", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l1_active_energy", "kWh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l1_reactive_energy", "kVArh", phase=NodePhase.L1, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
 
-    # L2
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l2_voltage", "V", phase=NodePhase.L2, logging=True, logging_period=15),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=14", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l2_current", "mA", phase=NodePhase.L2),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=13", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l2_active_power", "W", phase=NodePhase.L2),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=15", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l2_reactive_power", "VAr", phase=NodePhase.L2),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=16", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l2_apparent_power", "VA", phase=NodePhase.L2),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=17", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l2_power_factor", "", phase=NodePhase.L2),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=18", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l2_active_energy", "kWh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l2_reactive_energy", "kVArh", phase=NodePhase.L2, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
+def get_meter(name: str) -> EnergyMeterRecord:
+    """
+    Builds the energy meter record of a predefined meter model on demand.
 
-    # L3
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l3_voltage", "V", phase=NodePhase.L3, logging=True, logging_period=15),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=21", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l3_current", "mA", phase=NodePhase.L3),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=20", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l3_active_power", "W", phase=NodePhase.L3),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=22", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l3_reactive_power", "VAr", phase=NodePhase.L3),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=23", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l3_apparent_power", "VA", phase=NodePhase.L3),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=24", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l3_power_factor", "", phase=NodePhase.L3),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=25", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l3_active_energy", "kWh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "l3_reactive_energy", "kVArh", phase=NodePhase.L3, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
+    Records are not cached because the database layer assigns identifiers
+    to them on insertion, so every call returns a fresh record.
 
-    # Total
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("total_power_factor", "", phase=NodePhase.TOTAL),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=29", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "total_active_energy", "kWh", phase=NodePhase.TOTAL, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg(
-                "total_reactive_energy", "kVArh", phase=NodePhase.TOTAL, is_counter=True, counter_mode=CounterMode.DELTA, calculated=True
-            ),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("total_active_power", "kW", phase=NodePhase.TOTAL, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("total_reactive_power", "kVAr", phase=NodePhase.TOTAL, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
-    nodes.add(
-        Node(
-            configuration=cfg("total_apparent_power", "kVA", phase=NodePhase.TOTAL, calculated=True),
-            protocol_options=NoProtocolNodeOptions(type=NoProtocolType.FLOAT),
-        )
-    )
+    Args:
+        name (str): Key of the meter model in METER_FACTORIES.
 
-    # General
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("frequency", "Hz", phase=NodePhase.GENERAL),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=33", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l1_l2_voltage", "V", phase=NodePhase.GENERAL),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=26", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l2_l3_voltage", "V", phase=NodePhase.GENERAL),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=27", type=OPCUANodeType.FLOAT),
-        )
-    )
-    nodes.add(
-        OPCUANode(
-            configuration=cfg("l3_l1_voltage", "V", phase=NodePhase.GENERAL),
-            protocol_options=OPCUANodeOptions(node_id="ns=4;i=28", type=OPCUANodeType.FLOAT),
-        )
-    )
+    Returns:
+        EnergyMeterRecord: Newly built record for the requested meter model.
 
-    node_records: set[NodeRecord] = {node.get_node_record() for node in nodes}
+    Raises:
+        KeyError: If no meter model is registered under the given name.
+    """
 
-    return EnergyMeterRecord(
-        name="SM1238 S7-1200 Meter",
-        protocol=Protocol.OPC_UA,
-        type=EnergyMeterType.THREE_PHASE,
-        options=meter_options,
-        communication_options=communication_options,
-        nodes=node_records,
-    )
+    factory = METER_FACTORIES.get(name)
+    if factory is None:
+        raise KeyError(f"Unknown meter model: {name}")
+    return factory()
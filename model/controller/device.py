@@ -2,8 +2,8 @@
 
 from enum import Enum
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Optional, Dict, Any, Set
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Collection
 
 #######################################
 
@@ -11,6 +11,7 @@ from typing import Optional, Dict, Any, Set
 
 from model.controller.general import Protocol
 from model.controller.node import NodeRecord
+import util.functions.objects as objects
 
 #######################################
 
@@ -62,7 +63,7 @@ class EnergyMeterOptions:
             Dict[str, Any]: All configuration flags and values.
         """
 
-        return asdict(self)
+        return objects.shallow_asdict(self)
 
     @staticmethod
     def cast_from_dict(options_dict: Dict[str, Any]) -> "EnergyMeterOptions":
@@ -102,7 +103,7 @@ class BaseCommunicationOptions:
             Dict[str, Any]: A dictionary with all configuration flags and their values.
         """
 
-        return asdict(self)
+        return objects.shallow_asdict(self)
 
 
 @dataclass
@@ -123,7 +124,7 @@ class EnergyMeterRecord:
         options: Meter-level configuration options controlling exposed
             measurements and behavior.
         communication_options: Protocol-specific connection settings.
-        nodes: Set of node records associated with the meter.
+        nodes: Node records associated with the meter (names are unique within a meter).
         id: Identifier of the meter in the database, if assigned.
     """
 
@@ -132,7 +133,7 @@ class EnergyMeterRecord:
     type: EnergyMeterType
     options: EnergyMeterOptions
     communication_options: BaseCommunicationOptions
-    nodes: Set[NodeRecord]
+    nodes: Collection[NodeRecord]
     id: Optional[int] = None
 
 
@@ -161,4 +162,4 @@ class DeviceHistoryStatus:
         Returns:
             Dict[str, Any]: All status attributes as key-value pairs.
         """
-        return asdict(self)
+        return objects.shallow_asdict(self)
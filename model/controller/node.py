@@ -10,6 +10,7 @@ from typing import Optional, Dict, List, Any
 
 from model.controller.general import Protocol
 from model.date import FormattedTimeStep
+import util.functions.objects as objects
 
 #######################################
 
@@ -160,10 +161,10 @@ class BaseNodeProtocolOptions:
             Dict[str, Any]: A dictionary with all protocol options and it's values
         """
 
-        return asdict(self)
+        return objects.shallow_asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseNodeRecordConfig:
     """
     Base configuration for node records containing common attributes shared across all protocols.
@@ -199,7 +200,7 @@ class BaseNodeRecordConfig:
             Dict[str, Any]: A dictionary with all base configurations and it's values
         """
 
-        return asdict(self)
+        return objects.shallow_asdict(self)
 
     @staticmethod
     def cast_from_dict(config_dict: Dict[str, Any]) -> "BaseNodeRecordConfig":
@@ -259,7 +260,7 @@ class BaseNodeRecordConfig:
             raise ValueError(f"Couldn't cast dictionary into Node Record Base Configuration: {e}.")
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeAttributes:
     """
     Holds domain-specific attributes for a node.
@@ -278,7 +279,7 @@ class NodeAttributes:
             Dict[str, Any]: Dictionary containing all node attributes.
         """
 
-        return asdict(self)
+        return objects.shallow_asdict(self)
 
     @staticmethod
     def cast_from_dict(attributes_dict: Dict[str, Any]) -> "NodeAttributes":
@@ -301,7 +302,7 @@ class NodeAttributes:
             raise ValueError(f"Couldn't cast dictionary into Node Attributes: {e}.")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NodeRecord:
     """
     Persistent representation of a device node configuration.
@@ -322,40 +323,17 @@ class NodeRecord:
         attributes: Domain-level metadata associated with the node
             (e.g. phase, direction).
         device_id: Identifier of the parent device in the database, if assigned.
+
+    Records are immutable; equality and hashing only consider the name and device_id.
     """
 
     name: str
-    protocol: Protocol
-    config: BaseNodeRecordConfig
-    protocol_options: BaseNodeProtocolOptions
-    attributes: NodeAttributes
+    protocol: Protocol = field(compare=False)
+    config: BaseNodeRecordConfig = field(compare=False)
+    protocol_options: BaseNodeProtocolOptions = field(compare=False)
+    attributes: NodeAttributes = field(compare=False)
     device_id: Optional[int] = None
 
-    def __eq__(self, other):
-        """
-        Compares two NodeRecord instances for equality based on device_id and name.
-
-        Args:
-            other: Another object to compare with.
-
-        Returns:
-            bool: True if both objects are NodeRecord instances with same device_id and name.
-        """
-
-        if not isinstance(other, NodeRecord):
-            return False
-        return (self.device_id, self.name) == (other.device_id, other.name)
-
-    def __hash__(self):
-        """
-        Returns hash value based on device_id and name for use in sets and dictionaries.
-
-        Returns:
-            int: Hash value of the (device_id, name) tuple.
-        """
-
-        return hash((self.device_id, self.name))
-
     def get_attributes(self) -> Dict[str, Any]:
         """
         Return a dictionary representation of the node record for persistence or serialization.
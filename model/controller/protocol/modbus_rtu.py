@@ -150,6 +150,8 @@ class ModbusRTUNodeOptions(BaseNodeProtocolOptions):
         endian_mode (ModbusRTUNodeMode | None): Byte/word ordering for multi-register
             numeric types. None for single-register or coil values.
         bit (int | None): Optional bit index for boolean flags stored within registers.
+        poll_period (int | None): Optional interval in seconds between reads of the node.
+            None reads the node on every device read cycle.
     """
 
     function: ModbusRTUFunction
@@ -157,6 +159,7 @@ class ModbusRTUNodeOptions(BaseNodeProtocolOptions):
     type: ModbusRTUNodeType
     endian_mode: ModbusRTUNodeMode | None = None
     bit: int | None = None
+    poll_period: int | None = None
 
     @staticmethod
     def cast_from_dict(options_dict: Dict[str, Any]) -> "ModbusRTUNodeOptions":
@@ -178,7 +181,8 @@ class ModbusRTUNodeOptions(BaseNodeProtocolOptions):
             type = ModbusRTUNodeType(options_dict["type"])
             endian_mode = ModbusRTUNodeMode(options_dict["endian_mode"]) if options_dict["endian_mode"] is not None else None
             bit = int(options_dict["bit"]) if options_dict["bit"] is not None else None
-            return ModbusRTUNodeOptions(function, address, type, endian_mode, bit)
+            poll_period = int(options_dict["poll_period"]) if options_dict.get("poll_period") is not None else None
+            return ModbusRTUNodeOptions(function, address, type, endian_mode, bit, poll_period)
 
         except Exception as e:
             raise ValueError(f"Couldn't cast dictionary into Modbus RTU Node Options: {e}.")
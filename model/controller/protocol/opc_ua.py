@@ -51,10 +51,13 @@ class OPCUANodeOptions(BaseNodeProtocolOptions):
     Attributes:
         node_id (str): The OPC UA NodeId string (e.g., "ns=2;s=EnergyMeter/VoltageL1").
         type (OPCUANodeType): Expected data type of the node (BOOL, INT, FLOAT, STRING).
+        poll_period (int | None): Optional interval in seconds between reads of the node.
+            None reads the node on every device read cycle.
     """
 
     node_id: str
     type: OPCUANodeType
+    poll_period: int | None = None
 
     @staticmethod
     def cast_from_dict(options_dict: Dict[str, Any]) -> "OPCUANodeOptions":
@@ -72,7 +75,8 @@ class OPCUANodeOptions(BaseNodeProtocolOptions):
         try:
             node_id = str(options_dict["node_id"])
             type = OPCUANodeType(options_dict["type"])
-            return OPCUANodeOptions(node_id, type)
+            poll_period = int(options_dict["poll_period"]) if options_dict.get("poll_period") is not None else None
+            return OPCUANodeOptions(node_id, type, poll_period)
 
         except Exception as e:
             raise ValueError(f"Couldn't cast dictionary into OPC UA Node Options: {e}.")
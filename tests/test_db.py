@@ -0,0 +1,184 @@
+###########EXTERNAL IMPORTS############
+
+import asyncio
+import sqlite3
+import pytest
+
+#######################################
+
+#############LOCAL IMPORTS#############
+
+from db.db import SQLiteDBClient, SCHEMA_MIGRATIONS
+from meter_models.meters import get_meter
+
+#######################################
+
+
+def node_payloads(record):
+    return {
+        node.name: (
+            node.protocol,
+            node.config.get_config(),
+            node.protocol_options.get_options(),
+            node.attributes.get_attributes(),
+        )
+        for node in record.nodes
+    }
+
+
+@pytest.mark.asyncio
+async def test_energy_meter_round_trip(tmp_path):
+    db = SQLiteDBClient(str(tmp_path / "config.db"))
+    await db.init_connection()
+    try:
+        record = get_meter("orno_we_516")
+
+        async with db.transaction() as conn:
+            device_id = await db.insert_energy_meter(record, conn)
+        assert device_id is not None
+
+        meters = await db.get_all_energy_meters()
+        assert len(meters) == 1
+        stored = meters[0]
+        assert stored.id == device_id
+        assert stored.name == record.name
+        assert stored.communication_options == record.communication_options
+        assert node_payloads(stored) == node_payloads(record)
+
+        updated = get_meter("orno_we_516")
+        updated.id = device_id
+        updated.name = "Renamed meter"
+        updated.nodes = {node for node in updated.nodes if node.name != "frequency"}
+        next(node for node in updated.nodes if node.name == "l1_voltage").config.logging_period = 5
+        async with db.transaction() as conn:
+            assert await db.update_energy_meter(updated, conn) is True
+
+        stored = (await db.get_all_energy_meters())[0]
+        assert stored.name == "Renamed meter"
+        assert node_payloads(stored) == node_payloads(updated)
+
+        assert await db.update_device_last_seen(device_id) is True
+        history = await db.get_device_history(device_id)
+        assert history.last_seen is not None
+        assert history.created_at is not None
+        assert history.updated_at is not None
+
+        async with db.transaction() as conn:
+            assert await db.delete_device(device_id, conn) is True
+        assert await db.get_all_energy_meters() == []
+    finally:
+        await db.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_writer_for_memory_database():
+    db = SQLiteDBClient(":memory:", reader_count=2)
+    await db.init_connection()
+    try:
+        assert db.readers == []
+        async with db.reader() as conn:
+            assert conn is db.require_client()
+        assert await db.get_all_energy_meters() == []
+    finally:
+        await db.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_schema_version_is_recorded_and_reused(tmp_path):
+    db_path = str(tmp_path / "config.db")
+    for _ in range(2):
+        db = SQLiteDBClient(db_path, reader_count=0)
+        await db.init_connection()
+        try:
+            async with db.require_client().execute("PRAGMA user_version") as cursor:
+                assert (await cursor.fetchone())[0] == len(SCHEMA_MIGRATIONS)
+        finally:
+            await db.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back_on_error(tmp_path):
+    db = SQLiteDBClient(str(tmp_path / "config.db"))
+    await db.init_connection()
+    try:
+        with pytest.raises(RuntimeError):
+            async with db.transaction() as conn:
+                assert await db.insert_energy_meter(get_meter("sm1238"), conn) is not None
+                raise RuntimeError("abort")
+        assert await db.get_all_energy_meters() == []
+    finally:
+        await db.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_queued_last_seen_is_written_on_flush(tmp_path):
+    db = SQLiteDBClient(str(tmp_path / "config.db"))
+    await db.init_connection()
+    try:
+        async with db.transaction() as conn:
+            device_id = await db.insert_energy_meter(get_meter("sm1238"), conn)
+
+        assert await db.queue_device_last_seen(device_id) is True
+        assert await db.queue_device_last_seen(device_id + 1) is True  # Unknown devices are skipped
+        assert (await db.get_device_history(device_id)).last_seen is None
+
+        assert await db.flush_last_seen() is True
+        assert db.pending_last_seen == {}
+        assert (await db.get_device_history(device_id)).last_seen is not None
+    finally:
+        await db.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_last_seen_flush_keeps_queued_updates(tmp_path):
+    db = SQLiteDBClient(str(tmp_path / "config.db"))
+    await db.init_connection()
+    try:
+        async with db.transaction() as conn:
+            device_id = await db.insert_energy_meter(get_meter("sm1238"), conn)
+        await db.queue_device_last_seen(device_id)
+
+        async with db.write_lock:  # Holds the flush inside transaction() until it is cancelled
+            flush = asyncio.create_task(db.flush_last_seen())
+            await asyncio.sleep(0.05)
+            assert db.pending_last_seen == {}
+            flush.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await flush
+
+        assert device_id in db.pending_last_seen
+    finally:
+        await db.close_connection()
+
+    db = SQLiteDBClient(str(tmp_path / "config.db"))
+    await db.init_connection()
+    try:
+        assert (await db.get_device_history(device_id)).last_seen is not None  # Flushed on close
+    finally:
+        await db.close_connection()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_nodes_block_unique_names_migration(tmp_path):
+    db_path = str(tmp_path / "config.db")
+    with sqlite3.connect(db_path) as legacy:
+        legacy.executescript(f"{SCHEMA_MIGRATIONS[0]} PRAGMA user_version = 1;")
+        legacy.execute("INSERT INTO devices VALUES (1, 'meter', 'NONE', 'ORNO_WE_516', '{}', '{}')")
+        for _ in range(2):
+            legacy.execute(
+                "INSERT INTO nodes (device_id, name, protocol, config, protocol_options, attributes) "
+                "VALUES (1, 'voltage', 'NONE', '{}', '{}', '{}')"
+            )
+    legacy.close()
+
+    db = SQLiteDBClient(db_path, reader_count=0)
+    try:
+        with pytest.raises(RuntimeError, match="duplicate node names"):
+            await db.init_connection()
+    finally:
+        await db.close_connection()
+
+    with sqlite3.connect(db_path) as legacy:
+        assert legacy.execute("PRAGMA user_version").fetchone()[0] == 1
+        assert legacy.execute("SELECT COUNT(*) FROM nodes").fetchone()[0] == 2
+    legacy.close()
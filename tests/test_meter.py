@@ -11,6 +11,9 @@ from typing import Set
 
 from controller.node.node import Node, BaseNodeProtocolOptions
 from controller.meter.device import EnergyMeter
+from controller.meter.protocol.modbus_rtu.rtu_device import ModbusRTUEnergyMeter
+from controller.registry.protocol import ProtocolRegistry
+from meter_models.meters import get_meter
 from model.controller.general import Protocol
 from model.controller.device import EnergyMeterType, EnergyMeterOptions, BaseCommunicationOptions
 from model.controller.node import NodeType, NodeConfig
@@ -64,3 +67,31 @@ async def test_publish_nodes_filters_and_formats():
         "current": node2.get_publish_format(),
     }
     assert meter.publish_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_rtu_batch_groups_are_reused_for_polled_subsets():
+    record = get_meter("orno_we_516")
+    nodes = {ProtocolRegistry.get_protocol_plugin(node.protocol).node_factory(node) for node in record.nodes}
+    meter = ModbusRTUEnergyMeter(
+        id=1,
+        name="meter",
+        publish_queue=asyncio.Queue(),
+        measurements_queue=asyncio.Queue(),
+        meter_type=record.type,
+        meter_options=record.options,
+        communication_options=record.communication_options,
+        nodes=nodes,
+    )
+    batch_nodes = [node for node in meter.modbus_rtu_nodes if node.config.enabled and node.enable_batch_read]
+
+    assert meter.get_batch_groups(batch_nodes) is meter.batch_groups
+    cached_groups = meter.batch_groups
+
+    due_nodes = batch_nodes[:3]
+    due_groups = meter.get_batch_groups(due_nodes)
+    assert meter.batch_groups is cached_groups  # Polled subsets don't rebuild the cached structure
+    grouped = [(node, group) for groups in due_groups.values() for group in groups for node in group.nodes]
+    assert sorted(id(node) for node, _ in grouped) == sorted(id(node) for node in due_nodes)
+    for node, group in grouped:
+        assert group.start_addr <= node.options.address < group.start_addr + group.size
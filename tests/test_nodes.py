@@ -6,8 +6,10 @@ import pytest
 
 #############LOCAL IMPORTS#############
 
-from controller.node.node import Node
+from controller.node.node import Node, ModbusRTUNode
+from model.controller.general import Protocol
 from model.controller.node import NodeType, NodeConfig, CounterMode, BaseNodeProtocolOptions
+from model.controller.protocol.modbus_rtu import ModbusRTUNodeOptions, ModbusRTUFunction, ModbusRTUNodeType, ModbusRTUNodeMode
 from controller.node.processor.float_processor import FloatNodeProcessor
 
 #######################################
@@ -47,3 +49,14 @@ def test_publish_format_with_alarms_and_rounding():
     assert publish["unit"] == "V"
     assert publish["min_alarm_state"] is True
     assert publish["max_alarm_state"] is False
+
+
+def test_poll_period_skips_reads_until_elapsed():
+    options = ModbusRTUNodeOptions(
+        ModbusRTUFunction.READ_HOLDING_REGISTERS, 0x010A, ModbusRTUNodeType.FLOAT_32, ModbusRTUNodeMode.BIG_ENDIAN, poll_period=30
+    )
+    node = ModbusRTUNode(NodeConfig("forward_active_energy", NodeType.FLOAT, "kWh", Protocol.MODBUS_RTU), options)
+    assert node.check_poll_due(100.0) is True
+    assert node.check_poll_due(105.0) is False
+    assert node.check_poll_due(130.0) is True
+    assert ModbusRTUNodeOptions.cast_from_dict(options.get_options()) == options
@@ -0,0 +1,78 @@
+###########EXTERNAL IMPORTS############
+
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+#######################################
+
+#############LOCAL IMPORTS#############
+
+from db.timedb import TimeDBClient, Measurement, get_iso_minutes
+
+#######################################
+
+
+class DummyInfluxClient:
+    def __init__(self):
+        self.writes = []
+
+    def write_points(self, points, database, batch_size=None):
+        self.writes.append((database, points))
+        self.batch_size = batch_size
+        return True
+
+
+def log_point(name, value):
+    start_time = datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+    end_time = datetime(2024, 1, 1, 10, 5, tzinfo=timezone.utc)
+    return {"name": name, "start_time": start_time, "end_time": end_time, "value": value}
+
+
+@pytest.mark.asyncio
+async def test_write_data_groups_points_by_database():
+    timedb = TimeDBClient(host="localhost", port=8086)
+    timedb.client = DummyInfluxClient()
+
+    measurements = [
+        Measurement(db="meter_1", data=[log_point("active_energy", 1.0)]),
+        Measurement(db="meter_2", data=[log_point("active_energy", 2.0)]),
+        Measurement(db="meter_1", data=[log_point("reactive_energy", 3.0)]),
+        Measurement(db="meter_1", data=[log_point("frequency", None)]),  # Invalid measurements are skipped
+    ]
+
+    assert await timedb.write_data(measurements) is True
+    writes = dict(timedb.client.writes)
+    assert len(timedb.client.writes) == 2
+    assert [point["measurement"] for point in writes["meter_1"]] == ["active_energy", "reactive_energy"]
+    assert [point["fields"]["value"] for point in writes["meter_2"]] == [2.0]
+    assert writes["meter_1"][0]["fields"]["start_time"] == "2024-01-01T10:00+00:00"
+
+
+@pytest.mark.asyncio
+async def test_writer_batches_measurements_within_timeout():
+    timedb = TimeDBClient(host="localhost", port=8086, write_batch_size=100, write_batch_timeout=0.2)
+    timedb.client = DummyInfluxClient()
+    writer = asyncio.create_task(timedb.db_writer())
+    try:
+        await timedb.write_queue.put(Measurement(db="meter_1", data=[log_point("active_energy", 1.0)]))
+        await asyncio.sleep(0.05)
+        await timedb.write_queue.put(Measurement(db="meter_1", data=[log_point("reactive_energy", 2.0)]))
+        await asyncio.sleep(0.3)
+
+        assert len(timedb.client.writes) == 1
+        assert len(timedb.client.writes[0][1]) == 2
+        assert timedb.client.batch_size == 100
+    finally:
+        writer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await writer
+
+
+def test_cached_iso_minutes_keeps_time_zones_apart():
+    utc_time = datetime(2024, 1, 1, 10, 0, 30, tzinfo=timezone.utc)
+    tokyo_time = utc_time.astimezone(ZoneInfo("Asia/Tokyo"))
+
+    assert get_iso_minutes(utc_time, utc_time.tzinfo) == "2024-01-01T10:00+00:00"
+    assert get_iso_minutes(tokyo_time, tokyo_time.tzinfo) == "2024-01-01T19:00+09:00"
@@ -8,6 +8,9 @@ from typing import Optional, Union
 
 #######################################
 
+"""SI prefix factors by the first character of a unit string."""
+UNIT_PREFIXES = {"m": 1e-3, "": 1.0, "k": 1e3, "M": 1e6, "G": 1e9}
+
 
 def get_unit_factor(unit_str: Optional[str]) -> float:
     """
@@ -20,8 +23,6 @@ def get_unit_factor(unit_str: Optional[str]) -> float:
         Scaling factor to convert to base unit.
     """
 
-    UNIT_PREFIXES = {"m": 1e-3, "": 1.0, "k": 1e3, "M": 1e6, "G": 1e9}
-
     if not unit_str:
         return 1.0
     return UNIT_PREFIXES.get(unit_str[0], 1.0)
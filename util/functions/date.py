@@ -1,6 +1,7 @@
 ###########EXTERNAL IMPORTS############
 
 from typing import Tuple, Optional, List, Iterator
+from bisect import bisect_right
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 import arrow
@@ -541,13 +542,20 @@ def iterate_time_periods(
     return _iterator()
 
 
-def find_bucket_for_time(time: datetime, aligned_buckets: List[Tuple[datetime, datetime]]) -> datetime:
+def find_bucket_for_time(
+    time: datetime, aligned_buckets: List[Tuple[datetime, datetime]], bucket_starts: Optional[List[datetime]] = None
+) -> datetime:
     """
     Finds which time bucket contains a given datetime.
 
+    The buckets are sorted and non-overlapping, so the candidate bucket is located by
+    binary search over their start times.
+
     Args:
         time: Datetime to locate.
         aligned_buckets: List of (start, end) time bucket tuples.
+        bucket_starts: Optional start times of the aligned buckets, to avoid rebuilding them
+            when locating many datetimes in the same buckets.
 
     Returns:
         datetime: Start time of the bucket containing the datetime.
@@ -556,9 +564,13 @@ def find_bucket_for_time(time: datetime, aligned_buckets: List[Tuple[datetime, d
         ValueError: If datetime doesn't fall within any bucket.
     """
 
-    for bucket_start, bucket_end in aligned_buckets:
+    if bucket_starts is None:
+        bucket_starts = [bucket_start for bucket_start, _ in aligned_buckets]
 
-        if bucket_start <= time < bucket_end:
+    index = bisect_right(bucket_starts, time) - 1
+    if index >= 0:
+        bucket_start, bucket_end = aligned_buckets[index]
+        if time < bucket_end:
             return bucket_start
 
     raise ValueError(f"Didn't find an aligned bucket for time: {time}.")
@@ -1,23 +1,9 @@
 ###########EXTERNAL IMPORTS############
 
-from typing import (
-    Dict,
-    Any,
-    Type,
-    Union,
-    Tuple,
-    List,
-    Optional,
-    TypeVar,
-    get_origin,
-    get_args,
-    cast,
-)
-from types import UnionType
+from typing import Dict, Any, Type, Optional, TypeVar, get_origin
 from enum import Enum
-import dataclasses
+from dataclasses import fields
 import os
-from fastapi.datastructures import FormData, QueryParams
 
 #######################################
 
@@ -76,6 +62,24 @@ def resolve_type(t: Any) -> Any:
     return t
 
 
+def shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """
+    Convert a dataclass instance into a dictionary of its fields.
+
+    Unlike dataclasses.asdict, field values are neither recursed into nor deep-copied,
+    so it is only meant for dataclasses whose fields hold immutable values
+    (primitives, enums, datetimes).
+
+    Args:
+        obj (Any): Dataclass instance to convert.
+
+    Returns:
+        Dict[str, Any]: Mapping of field names to their current values.
+    """
+
+    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+
+
 def check_bool_str(string: Optional[str]) -> bool:
     """
     Convert string to boolean, case-insensitive check for "TRUE".
@@ -48,32 +48,28 @@ async def add_device(
     # NEEDS VALIDATION BETWEEN PARSING AND INSTANTIATION. MOVE CREATION TO END OF TRY BLOCK WHEN VALIDATION EXISTS
 
     # DB Update
-    conn = database.require_client()
     device_id = None
 
     try:
-        await conn.execute("BEGIN")
-        device_id = await database.insert_energy_meter(record, conn)
-        if device_id is None:
-            raise api_exception.DeviceCreationError(api_exception.Errors.DEVICE.DEVICE_STORAGE_FAILED)
+        async with database.transaction() as conn:
+            device_id = await database.insert_energy_meter(record, conn)
+            if device_id is None:
+                raise api_exception.DeviceCreationError(api_exception.Errors.DEVICE.DEVICE_STORAGE_FAILED)
 
-        record.id = device_id
-        new_device = device_manager.create_device_from_record(record)
+            record.id = device_id
+            new_device = device_manager.create_device_from_record(record)
 
 
-        if device_image:
-            image_result = await asyncio.get_running_loop().run_in_executor(img.api_executor, img.process_and_save_image, device_image, device_id, 200, "db/device_img/")
-            if not image_result:
-                raise api_exception.DeviceCreationError(api_exception.Errors.DEVICE.SAVE_IMAGE_FAILED)
+            if device_image:
+                image_result = await asyncio.get_running_loop().run_in_executor(img.api_executor, img.process_and_save_image, device_image, device_id, 200, "db/device_img/")
+                if not image_result:
+                    raise api_exception.DeviceCreationError(api_exception.Errors.DEVICE.SAVE_IMAGE_FAILED)
 
-        timedb_result = await asyncio.get_running_loop().run_in_executor(timedb.api_executor, timedb.create_db, device_name, device_id)
-        if not timedb_result:
-            raise api_exception.DeviceCreationError(api_exception.Errors.DEVICE.DEVICE_STORAGE_FAILED)
-
-        await conn.commit()
+            timedb_result = await asyncio.get_running_loop().run_in_executor(timedb.api_executor, timedb.create_db, device_name, device_id)
+            if not timedb_result:
+                raise api_exception.DeviceCreationError(api_exception.Errors.DEVICE.DEVICE_STORAGE_FAILED)
 
     except Exception:
-        await conn.rollback()
         if device_id:
             await asyncio.get_running_loop().run_in_executor(img.api_executor, img.delete_device_image, device_id, "db/device_img/")
         raise
@@ -106,23 +102,19 @@ async def edit_device(
         raise api_exception.DeviceNotFound(api_exception.Errors.DEVICE.NOT_FOUND, f"Device with id {device_id} not found.")
 
     # DB Update
-    conn =database.require_client()
-
     try:
-        await conn.execute("BEGIN")
-        if not await database.update_energy_meter(record, conn):
-            raise api_exception.DeviceUpdateError(api_exception.Errors.DEVICE.UPDATE_STORAGE_FAILED)
-        
-        if device_image:
-            image_result = await asyncio.get_running_loop().run_in_executor(img.api_executor, img.process_and_save_image, device_image, device_id, 200, "db/device_img/", "db/device_img/.bin/")
-            if not image_result:
-                raise api_exception.DeviceUpdateError(api_exception.Errors.DEVICE.SAVE_IMAGE_FAILED)
-
-        await conn.commit()
+        async with database.transaction() as conn:
+            if not await database.update_energy_meter(record, conn):
+                raise api_exception.DeviceUpdateError(api_exception.Errors.DEVICE.UPDATE_STORAGE_FAILED)
+            
+            if device_image:
+                image_result = await asyncio.get_running_loop().run_in_executor(img.api_executor, img.process_and_save_image, device_image, device_id, 200, "db/device_img/", "db/device_img/.bin/")
+                if not image_result:
+                    raise api_exception.DeviceUpdateError(api_exception.Errors.DEVICE.SAVE_IMAGE_FAILED)
+
         await asyncio.get_running_loop().run_in_executor(img.api_executor, img.flush_bin_images, "db/device_img/.bin/")
 
     except Exception:
-        await conn.rollback()
         await asyncio.get_running_loop().run_in_executor(img.api_executor, img.rollback_image, device_id, "db/device_img/", "db/device_img/.bin/")
         raise
 
@@ -156,19 +148,10 @@ async def delete_device(
         raise api_exception.DeviceNotFound(api_exception.Errors.DEVICE.NOT_FOUND, f"Device with id {device_id} not found.")
 
     # DB Update
-    conn = database.require_client()
-
-    try:
-        await conn.execute("BEGIN")
+    async with database.transaction() as conn:
         if not await database.delete_device(device.id, conn):
             raise api_exception.DeviceDeleteError(api_exception.Errors.DEVICE.DELETE_STORAGE_FAILED)
 
-        await conn.commit()
-
-    except Exception:
-        await conn.rollback()
-        raise
-
     await asyncio.get_running_loop().run_in_executor(img.api_executor, img.delete_device_image, device_id, "db/device_img/")
     await asyncio.get_running_loop().run_in_executor(timedb.api_executor, timedb.delete_db, device.name, device_id)
     await device_manager.delete_device(device)
@@ -1,6 +1,7 @@
 ###########EXTERNAL IMPORTS############
 
 import asyncio
+from dataclasses import replace
 from fastapi import APIRouter, Request, Depends
 from typing import Optional, Dict, Any
 from fastapi.responses import JSONResponse
@@ -71,7 +72,7 @@ async def get_node_extended_info(
     if not device:
         raise api_exception.DeviceNotFound(api_exception.Errors.DEVICE.NOT_FOUND, f"Device with id {device_id} not found.")
 
-    node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == name), None)
+    node = device.meter_nodes.nodes.get(name)
 
     if not node:
         raise api_exception.NodeNotFound(api_exception.Errors.NODES.NOT_FOUND)
@@ -99,14 +100,12 @@ async def get_nodes_config(
         nodes_config = {}
         for node in device.meter_nodes.nodes.values():
             if filter in node.config.name:
-                record = node.get_node_record()
-                record.device_id = device_id
+                record = replace(node.get_node_record(), device_id=device_id)
                 nodes_config[node.config.name] = record.get_attributes()
     else:
         nodes_config = {}
         for node in device.meter_nodes.nodes.values():
-            record = node.get_node_record()
-            record.device_id = device_id
+            record = replace(node.get_node_record(), device_id=device_id)
             nodes_config[node.config.name] = record.get_attributes()
 
     return JSONResponse(content=nodes_config)
@@ -132,7 +131,7 @@ async def get_logs_from_node(
     if not device:
         raise api_exception.DeviceNotFound(api_exception.Errors.DEVICE.NOT_FOUND, f"Device with id {device_id} not found.")
 
-    node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == name), None)
+    node = device.meter_nodes.nodes.get(name)
     if not node:
         raise api_exception.NodeNotFound(api_exception.Errors.NODES.NOT_FOUND)
 
@@ -240,7 +239,7 @@ async def delete_logs_from_node(
     if not device:
         raise api_exception.DeviceNotFound(api_exception.Errors.DEVICE.NOT_FOUND, f"Device with id {device_id} not found.")
 
-    node = next((n for n in device.meter_nodes.nodes.values() if n.config.name == name), None)
+    node = device.meter_nodes.nodes.get(name)
     if not node:
         raise api_exception.NodeNotFound(api_exception.Errors.NODES.NOT_FOUND)
 
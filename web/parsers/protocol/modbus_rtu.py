@@ -108,7 +108,7 @@ def parse_modbus_rtu_node_protocol_options(dict_protocol_options: Dict[str, Any]
     Parse and validate Modbus RTU node protocol options from an API payload.
 
     Extracts and converts protocol-specific node options, including function
-    code, address, data type, and optional endian mode or bit index. String
+    code, address, data type, and optional endian mode, bit index or poll period. String
     values are normalized into the corresponding Modbus RTU enums and a
     fully constructed ModbusRTUNodeOptions instance is returned.
 
@@ -162,6 +162,14 @@ def parse_modbus_rtu_node_protocol_options(dict_protocol_options: Dict[str, Any]
     # Parse Bit
     bit = parse_helper.parse_int_field_from_dict(dict_protocol_options, "bit", missing, True)
 
+    # Parse Poll Period
+    poll_period = None
+    if "poll_period" in dict_protocol_options:
+        poll_period = parse_helper.parse_int_field_from_dict(dict_protocol_options, "poll_period", missing, True)
+        if poll_period is not None and poll_period <= 0:
+            poll_period = None
+            missing.append("poll_period")
+
     if len(missing) > 0:
         raise api_exception.InvalidRequestPayload(
             api_exception.Errors.NODES.MISSING_NODE_PROTOCOL_OPTIONS_FIELDS, None, details={"missing_fields": missing}
@@ -173,7 +181,10 @@ def parse_modbus_rtu_node_protocol_options(dict_protocol_options: Dict[str, Any]
         or not isinstance(type, ModbusRTUNodeType)
         or not isinstance(endian_mode, (ModbusRTUNodeMode, NoneType))
         or not isinstance(bit, (int, NoneType))
+        or not isinstance(poll_period, (int, NoneType))
     ):
         raise ValueError(f"Invalid types in Modbus RTU Node Protocol options.")
 
-    return ModbusRTUNodeOptions(function=function, address=address, type=type, endian_mode=endian_mode, bit=bit)
+    return ModbusRTUNodeOptions(
+        function=function, address=address, type=type, endian_mode=endian_mode, bit=bit, poll_period=poll_period
+    )
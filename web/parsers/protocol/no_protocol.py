@@ -1,7 +1,6 @@
 ###########EXTERNAL IMPORTS############
 
 from typing import Dict, List, Any
-from types import NoneType
 
 #######################################
 
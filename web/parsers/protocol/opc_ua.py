@@ -75,7 +75,7 @@ def parse_opc_ua_node_protocol_options(dict_protocol_options: Dict[str, Any]) ->
     """
     Parse and validate OPC UA node protocol options from an API payload.
 
-    Extracts the OPC UA NodeId and expected data type from the input dictionary,
+    Extracts the OPC UA NodeId, expected data type and optional poll period from the input dictionary,
     converts string values into their corresponding OPC UA enums, and returns
     a fully constructed OPCUANodeOptions instance.
 
@@ -107,12 +107,20 @@ def parse_opc_ua_node_protocol_options(dict_protocol_options: Dict[str, Any]) ->
             type = None
             missing.append("type")
 
+    # Parse Poll Period
+    poll_period = None
+    if "poll_period" in dict_protocol_options:
+        poll_period = parse_helper.parse_int_field_from_dict(dict_protocol_options, "poll_period", missing, True)
+        if poll_period is not None and poll_period <= 0:
+            poll_period = None
+            missing.append("poll_period")
+
     if len(missing) > 0:
         raise api_exception.InvalidRequestPayload(
             api_exception.Errors.NODES.MISSING_NODE_PROTOCOL_OPTIONS_FIELDS, None, details={"missing_fields": missing}
         )
 
-    if not isinstance(node_id, str) or not isinstance(type, OPCUANodeType):
+    if not isinstance(node_id, str) or not isinstance(type, OPCUANodeType) or not isinstance(poll_period, (int, NoneType)):
         raise ValueError(f"Invalid types in OPC UA Node Protocol options.")
 
-    return OPCUANodeOptions(node_id=node_id, type=type)
+    return OPCUANodeOptions(node_id=node_id, type=type, poll_period=poll_period)